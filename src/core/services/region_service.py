@@ -10,21 +10,25 @@ import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
 
+# Resolved once at import; APP_ENV does not change while the app is running
+_DEBUG_MODE = os.getenv("APP_ENV", "development").strip().lower() != "production"
+
+
 def _is_debug_mode() -> bool:
     """Check if running in debug/development mode."""
-    app_env = os.getenv("APP_ENV", "development").strip().lower()
-    return app_env != "production"
+    return _DEBUG_MODE
 
 
 def _debug_print(message: str):
     """Print debug message only if in debug mode."""
-    if _is_debug_mode():
+    if _DEBUG_MODE:
         print(message)
 
 
 def discover_enabled_regions(
     aws_credentials: Optional[dict] = None,
-    aws_auth_method: str = "user"
+    aws_auth_method: str = "user",
+    session: Optional[boto3.Session] = None,
 ) -> List[str]:
     """
     Discover all enabled AWS regions for the current account.
@@ -32,6 +36,8 @@ def discover_enabled_regions(
     Args:
         aws_credentials: Optional credential overrides
         aws_auth_method: "user" or "role"
+        session: Optional boto3 Session already built for the scan; reused instead of
+            creating a client from aws_credentials or the environment
     
     Returns:
         List of region names (e.g., ["us-east-1", "us-west-2", ...])
@@ -42,7 +48,9 @@ def discover_enabled_regions(
         
         # Create EC2 client with credentials
         # Note: For role auth, the credentials should already contain temporary role credentials
-        if aws_credentials:
+        if session is not None:
+            ec2_client = session.client("ec2", region_name=session.region_name or default_region)
+        elif aws_credentials:
             ec2_client = _create_ec2_client(default_region, aws_credentials)
         else:
             # Use environment variables
@@ -4,7 +4,8 @@ Scan orchestration service - centralized business logic for running scans
 
 from typing import Tuple, Optional, Mapping, Dict, Any
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
+from zoneinfo import ZoneInfo
 import time
 
 from ..exceptions import ScanError, DatabaseError, ValidationError
@@ -14,6 +15,8 @@ from ..validators import InputValidator
 from scanners.ec2_scanner import scan_ec2
 from db.repo import save_scan_results
 
+_IL_TZ = ZoneInfo("Asia/Jerusalem")
+
 
 class ScanService:
     """Central service for orchestrating cloud waste scans"""
@@ -68,8 +71,7 @@ class ScanService:
             )
             
             # Generate timestamp in Israel time
-            israel_time = datetime.utcnow() + timedelta(hours=3)
-            scanned_at = israel_time.replace(microsecond=0).isoformat() + " (Israel Time)"
+            scanned_at = datetime.now(_IL_TZ).replace(microsecond=0, tzinfo=None).isoformat() + " (Israel Time)"
             
             # Save to database if requested
             if save_to_db:
@@ -0,0 +1,13 @@
+# src/cwt_ui/_bootstrap.py
+"""Put src/ on sys.path for the Streamlit scripts (app.py and the pages).
+
+``streamlit run src/cwt_ui/app.py`` only puts this directory on sys.path, so the scripts
+import this module as top-level ``_bootstrap`` before any ``cwt_ui`` import. Python caches
+it after the first import, so reruns and page switches skip the path setup entirely.
+"""
+import sys
+from pathlib import Path
+
+_SRC_DIR = str(Path(__file__).resolve().parent.parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
@@ -2,21 +2,11 @@
 from __future__ import annotations
 
 import os
-import sys
-from pathlib import Path
+from datetime import datetime, timezone
 from typing import List
 import importlib
 
-# Ensure src/ is on sys.path before importing internal packages
-APP_DIR = Path(__file__).resolve().parent
-REPO_ROOT = APP_DIR
-for p in [APP_DIR, *APP_DIR.parents]:
-    if (p / "src").exists():
-        REPO_ROOT = p
-        break
-SRC_DIR = REPO_ROOT / "src"
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
+import _bootstrap  # noqa: F401  (puts src/ on sys.path before any cwt_ui import)
 
 import pandas as pd
 import streamlit as st
@@ -43,10 +33,11 @@ except ImportError:
     # dotenv not installed, that's okay
     pass
 
-# Debug utility (disabled)
-def debug_write(message: str):
-    """Debug messages disabled - no-op function"""
-    pass
+# Fallback region, read once after .env is loaded instead of on every rerun
+_DEFAULT_REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
+
+# Debug utility (disabled) - shared no-op from utils.metrics
+from cwt_ui.utils.metrics import debug_write
 
 # Get APP_ENV from settings
 try:
@@ -81,15 +72,18 @@ if scans is None:
 # from the pages/ directory. Do not import them here as it causes them to render.
 
 # === Helpers ===
+# "recommendation is OK" -> status badge
+_STATUS_LABELS = {True: "🟢 OK", False: "🔴 Action"}
+
+
 def add_status(df: pd.DataFrame) -> pd.DataFrame:
     """Add status column to dataframe based on recommendation."""
     if df is None or df.empty:
         return pd.DataFrame()
     out = df.copy()
     if "recommendation" in out.columns and "status" not in out.columns:
-        out["status"] = out["recommendation"].astype(str).str.upper().map(
-            lambda x: "🟢 OK" if x == "OK" else "🔴 Action"
-        )
+        # Vectorized "is OK" test, then a prebuilt dict lookup rather than a Python lambda per row
+        out["status"] = out["recommendation"].astype(str).str.upper().eq("OK").map(_STATUS_LABELS)
     return out
 
 def run_live_scans(region: str | List[str] | None = None) -> pd.DataFrame:
@@ -130,10 +124,11 @@ def run_live_scans(region: str | List[str] | None = None) -> pd.DataFrame:
         if st.session_state.get("aws_override_enabled"):
             debug_write("🔍 **DEBUG:** Using session-scoped credentials")
             auth_method = st.session_state.get("aws_auth_method", "role")
+            # Strip the region once and resolve its fallback for both auth branches
+            rg = st.session_state.get("aws_default_region", "").strip() or _DEFAULT_REGION
             
             # For role-based auth
             if auth_method == "role":
-                rg = st.session_state.get("aws_default_region", "").strip()
                 creds = {}
                 
                 # Add role-specific fields
@@ -141,7 +136,7 @@ def run_live_scans(region: str | List[str] | None = None) -> pd.DataFrame:
                     "AWS_ROLE_ARN": st.session_state.get("aws_role_arn", "").strip(),
                     "AWS_EXTERNAL_ID": st.session_state.get("aws_external_id", "").strip(),
                     "AWS_ROLE_SESSION_NAME": st.session_state.get("aws_role_session_name", "CloudWasteTracker").strip(),
-                    "AWS_DEFAULT_REGION": rg or os.getenv("AWS_DEFAULT_REGION", "us-east-1"),
+                    "AWS_DEFAULT_REGION": rg,
                 }
                 creds.update({k: v for k, v in role_fields.items() if v})
                 debug_write(f"   - Role ARN: {role_fields.get('AWS_ROLE_ARN', 'NOT SET')}")
@@ -150,7 +145,6 @@ def run_live_scans(region: str | List[str] | None = None) -> pd.DataFrame:
                 # Legacy IAM User auth (if needed)
                 ak = st.session_state.get("aws_access_key_id", "").strip()
                 sk = st.session_state.get("aws_secret_access_key", "").strip()
-                rg = st.session_state.get("aws_default_region", "").strip()
                 stoken = st.session_state.get("aws_session_token", "").strip()
                 
                 creds = {
@@ -158,7 +152,7 @@ def run_live_scans(region: str | List[str] | None = None) -> pd.DataFrame:
                     for k, v in {
                         "AWS_ACCESS_KEY_ID": ak,
                         "AWS_SECRET_ACCESS_KEY": sk,
-                        "AWS_DEFAULT_REGION": rg or os.getenv("AWS_DEFAULT_REGION", "us-east-1"),
+                        "AWS_DEFAULT_REGION": rg,
                         "AWS_SESSION_TOKEN": stoken,
                     }.items()
                     if v
@@ -173,18 +167,18 @@ def run_live_scans(region: str | List[str] | None = None) -> pd.DataFrame:
         debug_write(f"   - Auth method: {auth_method}")
         ec2_df = scans.run_all_scans(region=region, aws_credentials=creds, aws_auth_method=auth_method)  # type: ignore
         debug_write("🔍 **DEBUG:** scans.run_all_scans() completed")
-        # Stamp scan time
-        import datetime as _dt
-        scanned_at = _dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+        # Stamp scan time (UTC)
+        scanned_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         st.session_state["last_scan_at"] = scanned_at
         debug_write(f"🔍 **DEBUG:** Scan timestamp: {scanned_at}")
         
+        if ec2_df is None or ec2_df.empty:
+            # Nothing to stamp or classify
+            return pd.DataFrame()
+        
         def _stamp(df: pd.DataFrame) -> pd.DataFrame:
-            if df is None or df.empty:
-                return pd.DataFrame()
-            out = df.copy()
-            out["scanned_at"] = scanned_at
-            return out
+            # assign() already returns a new frame; a typed string column avoids a per-row object column
+            return df.assign(scanned_at=pd.array([scanned_at] * len(df), dtype="string"))
         
         debug_write("🔍 **DEBUG:** Adding status and timestamp to dataframe...")
         result_ec2 = add_status(_stamp(ec2_df))
@@ -203,9 +197,6 @@ render_page_header(
     icon="💸",
 )
 
-# DEBUG: Page load indicator
-debug_write("🔍 **DEBUG:** Main app.py loaded")
-
 # Session defaults
 st.session_state.setdefault("ec2_df", pd.DataFrame())
 # Don't set a default single region - prefer auto-discovery of all enabled regions
@@ -215,28 +206,13 @@ st.session_state.setdefault("ec2_df", pd.DataFrame())
 st.session_state.setdefault("aws_override_enabled", False)
 st.session_state.setdefault("aws_access_key_id", "")
 st.session_state.setdefault("aws_secret_access_key", "")
-st.session_state.setdefault("aws_default_region", os.getenv("AWS_DEFAULT_REGION", "us-east-1"))
+st.session_state.setdefault("aws_default_region", _DEFAULT_REGION)
 st.session_state.setdefault("aws_session_token", "")
 st.session_state.setdefault("aws_role_arn", "")
 st.session_state.setdefault("aws_external_id", "")
 st.session_state.setdefault("aws_role_session_name", "CloudWasteTracker")
 st.session_state.setdefault("aws_auth_method", "user")
 
-# DEBUG: Session state check
-debug_write("🔍 **DEBUG:** Session state initialized")
-debug_write(f"   - Region: {st.session_state.get('region', 'NOT SET')}")
-debug_write(f"   - EC2 data: {st.session_state.get('ec2_df', pd.DataFrame()).shape if not st.session_state.get('ec2_df', pd.DataFrame()).empty else 'EMPTY'}")
-debug_write(f"   - Last scan: {st.session_state.get('last_scan_at', 'NEVER')}")
-
-# DEBUG: Credentials check
-if st.session_state.get("aws_override_enabled"):
-    debug_write("🔍 **DEBUG:** AWS credentials override ENABLED")
-    debug_write(f"   - Access Key: {'SET' if st.session_state.get('aws_access_key_id') else 'NOT SET'}")
-    debug_write(f"   - Secret Key: {'SET' if st.session_state.get('aws_secret_access_key') else 'NOT SET'}")
-    debug_write(f"   - Region: {st.session_state.get('aws_default_region', 'NOT SET')}")
-else:
-    debug_write("🔍 **DEBUG:** Using environment AWS credentials")
-
 # Optional auto-run is disabled by default to avoid blocking app startup in deployments.
 # Enable by setting env CWT_AUTO_SCAN_ON_START=true
 auto_scan = os.getenv("CWT_AUTO_SCAN_ON_START", "false").strip().lower() == "true"
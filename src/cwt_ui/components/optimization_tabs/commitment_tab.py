@@ -1,32 +1,35 @@
 # Optimization > Commitment (Savings Plans, EC2 vs SP) tab
 from __future__ import annotations
 
+import functools
 import os
-import sys
 from pathlib import Path
+from types import CodeType
 
 import streamlit as st
 
-# Ensure src on path for loading page modules (pages are under cwt_ui/pages)
+# Archived page scripts rendered inside this tab (under cwt_ui/pages)
 _pages_dir = Path(__file__).resolve().parent.parent.parent / "pages"
-for p in [Path(__file__).resolve().parent, *Path(__file__).resolve().parent.parents]:
-    if (p / "src").exists() and str(p / "src") not in sys.path:
-        sys.path.insert(0, str(p / "src"))
-        break
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_page(path: Path, mtime_ns: int) -> CodeType:
+    """Compile a page script once per file version instead of on every rerun."""
+    return compile(path.read_bytes(), str(path), "exec")
 
 
 def _run_page_as_tab(script_name: str) -> None:
     """Load and run a page script without its set_page_config/header (for embedding in tab)."""
-    import importlib.util
     path = _pages_dir / script_name
-    if not path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
         st.info(f"Page module not found: {script_name}")
         return
+    code = _compile_page(path, mtime_ns)
     try:
         os.environ["CWT_AS_TAB"] = "1"
-        spec = importlib.util.spec_from_file_location("_tab_page", path)
-        mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)
+        exec(code, {"__name__": "_tab_page", "__file__": str(path)})
     finally:
         os.environ.pop("CWT_AS_TAB", None)
 
@@ -42,8 +42,14 @@ def render_data_transfer_tab() -> None:
     st.markdown("#### Data transfer")
     display_df = filtered[["region", "transfer_type", "destination", "data_gb", "monthly_cost_usd", "recommendation", "potential_savings_usd"]].copy()
     display_df.columns = ["Region", "Type", "Destination", "Data (GB)", "Monthly cost", "Recommendation", "Potential savings"]
-    display_df["Monthly cost"] = display_df["Monthly cost"].apply(lambda x: format_usd(x))
-    display_df["Potential savings"] = display_df["Potential savings"].apply(lambda x: format_usd(x))
-    st.dataframe(display_df, use_container_width=True, hide_index=True)
+    st.dataframe(
+        display_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Monthly cost": st.column_config.NumberColumn("Monthly cost", format="dollar"),
+            "Potential savings": st.column_config.NumberColumn("Potential savings", format="dollar"),
+        },
+    )
     if data_source == "synthetic":
         st.caption("Synthetic data. Real data transfer optimization requires Cost Explorer or CUR with data transfer breakdown.")
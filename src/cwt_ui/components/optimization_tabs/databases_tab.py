@@ -42,8 +42,14 @@ def render_databases_tab() -> None:
     st.markdown("#### RDS & DynamoDB")
     display_df = filtered[["resource_id", "service", "instance_type", "region", "monthly_cost_usd", "recommendation", "potential_savings_usd"]].copy()
     display_df.columns = ["Resource ID", "Service", "Instance / mode", "Region", "Monthly cost", "Recommendation", "Potential savings"]
-    display_df["Monthly cost"] = display_df["Monthly cost"].apply(lambda x: format_usd(x))
-    display_df["Potential savings"] = display_df["Potential savings"].apply(lambda x: format_usd(x))
-    st.dataframe(display_df, use_container_width=True, hide_index=True)
+    st.dataframe(
+        display_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Monthly cost": st.column_config.NumberColumn("Monthly cost", format="dollar"),
+            "Potential savings": st.column_config.NumberColumn("Potential savings", format="dollar"),
+        },
+    )
     if data_source == "synthetic":
         st.caption("Synthetic data. Real database optimization requires Cost Explorer, CUR, or RDS/DynamoDB APIs.")
@@ -11,56 +11,193 @@ import streamlit as st
 from cwt_ui.components.ui.overview_cards import render_sec_card
 from cwt_ui.utils.money import format_usd
 
+# Larger inventories are shown a page at a time so each rerun only ships one page to the browser
+_TABLE_PAGE_SIZE = 1000
+# Session-state slot for (raw ec2_df, normalized frame)
+_NORMALIZED_KEY = "_ec2_tab_normalized"
+# Session-state slot for (normalized frame, filter values, filtered frame)
+_FILTERED_KEY = "_ec2_tab_filtered"
+# Session-state slot for (filtered frame, page start row, display table)
+_TABLE_KEY = "_ec2_tab_table"
 
-def _safe_column(df: pd.DataFrame, names: list[str], default=None):
-    for name in names:
-        if name in df.columns:
-            return df[name]
+
+# Canonical column -> accepted scan/export spellings, in priority order
+_COLUMN_ALIASES = {
+    "instance_id": ("instance_id", "InstanceId"),
+    "region": ("region", "Region"),
+    "name": ("name", "Name", "tag_Name"),
+    "monthly_cost_usd": ("monthly_cost_usd", "Monthly Cost (USD)"),
+    "avg_cpu_7d": ("avg_cpu_7d", "CPU Utilization (%)"),
+    "state": ("state", "State"),
+    "billing_type": ("billing_type", "Billing Type"),
+    "recommendation": ("recommendation", "Recommendation"),
+}
+
+
+def _resolve_columns(columns: set[str]) -> dict[str, str | None]:
+    """Map each canonical column to the first alias present (None when absent)."""
+    return {key: next((name for name in names if name in columns), None) for key, names in _COLUMN_ALIASES.items()}
+
+
+def _safe_column(df: pd.DataFrame, name: str | None, default=None):
+    if name is not None:
+        return df[name]
     return pd.Series(default, index=df.index)
 
 
+def _as_numeric(series: pd.Series) -> pd.Series:
+    """Scan columns are usually numeric already; only coerce object columns."""
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+    return pd.to_numeric(series, errors="coerce")
+
+
 def _ensure_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize scan columns for the tab."""
     out = df.copy()
-    out["instance_id"] = _safe_column(out, ["instance_id", "InstanceId"], "unknown")
-    out["region"] = _safe_column(out, ["region", "Region"], "unknown")
-    out["name"] = _safe_column(out, ["name", "Name", "tag_Name"], "").fillna("")
-    out["monthly_cost_usd"] = (
-        pd.to_numeric(_safe_column(out, ["monthly_cost_usd", "Monthly Cost (USD)"], 0.0), errors="coerce").fillna(0.0)
-    )
-    out["avg_cpu_7d"] = (
-        pd.to_numeric(_safe_column(out, ["avg_cpu_7d", "CPU Utilization (%)"], np.nan), errors="coerce").clip(
-            lower=0, upper=100
-        )
-    )
-    out["state"] = _safe_column(out, ["state", "State"], "unknown").str.title()
+    raw_columns = set(df.columns)
+    src = _resolve_columns(raw_columns)
+    out["instance_id"] = _safe_column(out, src["instance_id"], "unknown")
+    out["region"] = _safe_column(out, src["region"], "unknown")
+    out["name"] = _safe_column(out, src["name"], "").fillna("")
+    out["monthly_cost_usd"] = _as_numeric(_safe_column(out, src["monthly_cost_usd"], 0.0)).fillna(0.0)
+    out["avg_cpu_7d"] = _as_numeric(_safe_column(out, src["avg_cpu_7d"], np.nan)).clip(lower=0, upper=100)
+    out["state"] = _safe_column(out, src["state"], "unknown").str.title()
     out["billing_type"] = (
-        _safe_column(out, ["billing_type", "Billing Type"], "On-Demand")
+        _safe_column(out, src["billing_type"], "On-Demand")
         .fillna("On-Demand")
         .replace({"sp": "SP-Covered", "Savings Plans": "SP-Covered"})
     )
-    department_columns = [col for col in out.columns if "department" in col.lower()]
+    out["sp_covered"] = out["billing_type"].str.contains("SP", case=False, na=False)
+    department_columns = [col for col in df.columns if "department" in col.lower()]
     if department_columns:
         out["department"] = out[department_columns[0]].fillna("Unassigned")
-    elif "tags" in out.columns and out["tags"].notna().any():
-        out["department"] = out["tags"].apply(
-            lambda tags: tags.get("department", "Unassigned") if isinstance(tags, dict) else "Unassigned"
-        )
+    elif "tags" in raw_columns and out["tags"].notna().any():
+        # Plain comprehension over the raw array skips apply's per-row call overhead
+        out["department"] = [
+            tags.get("department", "Unassigned") if isinstance(tags, dict) else "Unassigned"
+            for tags in out["tags"].to_numpy()
+        ]
     else:
         out["department"] = "Unassigned"
-    if "idle_score" in out.columns:
-        out["idle_score"] = pd.to_numeric(out["idle_score"], errors="coerce").fillna(0.0)
+    if "idle_score" in raw_columns:
+        out["idle_score"] = _as_numeric(out["idle_score"]).fillna(0.0)
     else:
         out["idle_score"] = (1 - (out["avg_cpu_7d"] / 100.0)).clip(lower=0, upper=1) * 100
-    if "potential_savings_usd" not in out.columns:
+    if "potential_savings_usd" not in raw_columns:
         out["potential_savings_usd"] = out["monthly_cost_usd"] * (out["idle_score"] / 100.0)
-    if "scanned_at" in out.columns:
+    if "scanned_at" in raw_columns:
+        # Every row of a scan shares one timestamp; to_datetime's default cache parses each once
         out["scanned_at_ts"] = pd.to_datetime(out["scanned_at"], errors="coerce")
     else:
         out["scanned_at_ts"] = pd.NaT
-    out["recommendation"] = _safe_column(out, ["recommendation", "Recommendation"], "Review instance sizing").fillna(
+    # Date part for the scan-date filter, so the mask doesn't redo .dt.date on every filter change
+    out["scanned_at_date"] = out["scanned_at_ts"].dt.date
+    out["recommendation"] = _safe_column(out, src["recommendation"], "Review instance sizing").fillna(
         "Review instance sizing"
     )
-    return out
+    # Low-cardinality labels as categoricals: isin/unique/contains work on the codes, and Arrow
+    # sends them dictionary-encoded to the browser
+    return out.astype({"region": "category", "state": "category", "billing_type": "category", "department": "category"})
+
+
+def _normalized_ec2_df(ec2_df: pd.DataFrame) -> tuple[pd.DataFrame, list[str], list[str]]:
+    """_ensure_columns output plus the region/department filter options for the session's ec2_df,
+    reused until a scan stores a new frame.
+
+    Keyed by object identity: scans replace ec2_df rather than mutating it, and holding the raw
+    frame in the entry keeps its id from being reused, so no per-rerun content hash is needed.
+    """
+    cached = st.session_state.get(_NORMALIZED_KEY)
+    if cached is not None and cached[0] is ec2_df:
+        return cached[1:]
+    normalized = _ensure_columns(ec2_df)
+    regions = sorted(normalized["region"].dropna().unique().tolist())
+    departments = sorted(normalized["department"].dropna().unique().tolist())
+    st.session_state[_NORMALIZED_KEY] = (ec2_df, normalized, regions, departments)
+    return normalized, regions, departments
+
+
+def _filter_ec2_df(
+    df: pd.DataFrame,
+    regions: tuple[str, ...],
+    departments: tuple[str, ...],
+    idle_only: bool,
+    search_query: str,
+    date_range: tuple[date, date] | None,
+) -> tuple[pd.DataFrame, tuple[int, float, float, float]]:
+    """Apply the tab filters as one combined mask and compute the KPI row for the result.
+
+    Both are reused while neither the frame nor any filter value changed (e.g. reruns from
+    paging or other tabs).
+    """
+    key = (regions, departments, idle_only, search_query, date_range)
+    cached = st.session_state.get(_FILTERED_KEY)
+    if cached is not None and cached[0] is df and cached[1] == key:
+        return cached[2], cached[3]
+    mask = np.ones(len(df), dtype=bool)
+    if regions:
+        mask &= df["region"].isin(regions).to_numpy()
+    if departments:
+        mask &= df["department"].isin(departments).to_numpy()
+    if idle_only:
+        mask &= (df["idle_score"] >= 70).to_numpy()
+    if search_query:
+        id_hit = df["instance_id"].str.contains(search_query, case=False, regex=False, na=False)
+        name_hit = df["name"].str.contains(search_query, case=False, regex=False, na=False)
+        mask &= (id_hit | name_hit).to_numpy()
+    if date_range:
+        start_date, end_date = date_range
+        scan_dates = df["scanned_at_date"]
+        mask &= (df["scanned_at_ts"].notna() & (scan_dates >= start_date) & (scan_dates <= end_date)).to_numpy()
+    filtered = df[mask]
+    kpis = _ec2_kpis(filtered)
+    st.session_state[_FILTERED_KEY] = (df, key, filtered, kpis)
+    return filtered, kpis
+
+
+def _ec2_kpis(filtered: pd.DataFrame) -> tuple[int, float, float, float]:
+    """(instance count, monthly spend, % SP-covered, idle cost) from plain array sums."""
+    total_instances = len(filtered)
+    if not total_instances:
+        return 0, 0.0, 0.0, 0.0
+    cost = filtered["monthly_cost_usd"].to_numpy()
+    idle = filtered["idle_score"].to_numpy() >= 70
+    coverage_pct = filtered["sp_covered"].to_numpy().sum() / total_instances * 100
+    return total_instances, float(cost.sum()), float(coverage_pct), float(cost[idle].sum())
+
+
+def _inventory_table(filtered: pd.DataFrame, start: int) -> pd.DataFrame:
+    """Display table for one page of the filtered frame, reused while the filtered frame
+    (memoized by _filter_ec2_df) and the page are unchanged."""
+    cached = st.session_state.get(_TABLE_KEY)
+    if cached is not None and cached[0] is filtered and cached[1] == start:
+        return cached[2]
+    page_rows = filtered.iloc[start : start + _TABLE_PAGE_SIZE]
+    table = pd.DataFrame(
+        {
+            "Instance ID": page_rows["instance_id"],
+            "Region": page_rows["region"],
+            "Name/Tag": page_rows["name"].replace("", "—"),
+            "Monthly Cost ($)": page_rows["monthly_cost_usd"],
+            "State": page_rows["state"],
+            "CPU Utilization (%)": page_rows["avg_cpu_7d"],
+            "Idle Score": page_rows["idle_score"].round(1),
+            "Billing Type": page_rows["billing_type"],
+            "Recommendation": page_rows["recommendation"],
+            "Potential Savings ($)": page_rows["potential_savings_usd"],
+        }
+    )
+    table["Issue Badge"] = np.select(
+        [
+            table["Idle Score"].to_numpy() >= 85,
+            table["Recommendation"].str.contains("rightsize", case=False, na=False).to_numpy(),
+        ],
+        ["🔴 High Idle", "🟠 Rightsize"],
+        default="",
+    )
+    st.session_state[_TABLE_KEY] = (filtered, start, table)
+    return table
 
 
 def render_ec2_tab() -> None:
@@ -68,10 +205,7 @@ def render_ec2_tab() -> None:
     if ec2_df is None or ec2_df.empty:
         st.info("Run a scan from **Setup** to populate EC2 instance data.")
         return
-    ec2_df = _ensure_columns(ec2_df)
-
-    regions = sorted(ec2_df["region"].dropna().unique().tolist())
-    departments = sorted(ec2_df["department"].dropna().unique().tolist())
+    ec2_df, regions, departments = _normalized_ec2_df(ec2_df)
     st.markdown("#### Filters")
     col1, col2, col3 = st.columns([1, 1, 1])
     with col1:
@@ -96,38 +230,14 @@ def render_ec2_tab() -> None:
             date_range = st.date_input(
                 "Scan date range", value=(default_start, default_end), min_value=min_date, max_value=max_date, key="ec2_tab_dates"
             )
-    filtered = ec2_df.copy()
-    if selected_regions:
-        filtered = filtered[filtered["region"].isin(selected_regions)]
-    if selected_departments:
-        filtered = filtered[filtered["department"].isin(selected_departments)]
-    if idle_only:
-        filtered = filtered[filtered["idle_score"] >= 70]
-    if search_query:
-        q = search_query.lower()
-        filtered = filtered[
-            filtered["instance_id"].str.lower().str.contains(q) | filtered["name"].str.lower().str.contains(q)
-        ]
-    if date_range and isinstance(date_range, tuple) and len(date_range) == 2:
-        start_date, end_date = date_range
-        if isinstance(start_date, date) and isinstance(end_date, date):
-            mask = (
-                filtered["scanned_at_ts"].notna()
-                & (filtered["scanned_at_ts"].dt.date >= start_date)
-                & (filtered["scanned_at_ts"].dt.date <= end_date)
-            )
-            filtered = filtered[mask]
+    if not (isinstance(date_range, tuple) and len(date_range) == 2 and all(isinstance(d, date) for d in date_range)):
+        date_range = None  # partial range while the user is still picking the end date
+    filtered, (total_instances, monthly_spend, coverage_pct, idle_cost) = _filter_ec2_df(
+        ec2_df, tuple(selected_regions), tuple(selected_departments), idle_only, search_query, date_range
+    )
     if filtered.empty:
         st.warning("No EC2 instances match your current filters.")
         return
-    total_instances = len(filtered)
-    monthly_spend = filtered["monthly_cost_usd"].sum()
-    if filtered["billing_type"].notna().any():
-        covered = filtered["billing_type"].str.contains("SP", case=False, na=False)
-        coverage_pct = (covered.sum() / total_instances) * 100 if total_instances else 0.0
-    else:
-        coverage_pct = 0.0
-    idle_cost = filtered.loc[filtered["idle_score"] >= 70, "monthly_cost_usd"].sum()
     kpi_cols = st.columns(4)
     with kpi_cols[0]:
         render_sec_card("Total EC2 Instances", f"{total_instances:,}", "Number of EC2 instances after filters.")
@@ -137,28 +247,16 @@ def render_ec2_tab() -> None:
         render_sec_card("% Covered by Savings Plans", f"{coverage_pct:.1f}%", "SP coverage.")
     with kpi_cols[3]:
         render_sec_card("Estimated Idle/Waste Cost", format_usd(idle_cost), "Monthly cost from highly idle.")
-    table = pd.DataFrame(
-        {
-            "Instance ID": filtered["instance_id"],
-            "Region": filtered["region"],
-            "Name/Tag": filtered["name"].replace("", "—"),
-            "Monthly Cost ($)": filtered["monthly_cost_usd"],
-            "State": filtered["state"],
-            "CPU Utilization (%)": filtered["avg_cpu_7d"].fillna(0.0),
-            "Idle Score": filtered["idle_score"].round(1),
-            "Billing Type": filtered["billing_type"],
-            "Recommendation": filtered["recommendation"],
-            "Potential Savings ($)": filtered["potential_savings_usd"],
-        }
-    )
-    def badge(row):
-        if row["Idle Score"] >= 85:
-            return "🔴 High Idle"
-        if row["Recommendation"] and "rightsize" in str(row["Recommendation"]).lower():
-            return "🟠 Rightsize"
-        return ""
-    table["Issue Badge"] = table.apply(badge, axis=1)
     st.markdown("#### EC2 Inventory")
+    start = 0
+    if total_instances > _TABLE_PAGE_SIZE:
+        page_count = -(-total_instances // _TABLE_PAGE_SIZE)
+        if st.session_state.get("ec2_tab_page", 1) > page_count:
+            st.session_state.pop("ec2_tab_page")  # filters shrank the result; start over at page 1
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1, key="ec2_tab_page")
+        start = (int(page) - 1) * _TABLE_PAGE_SIZE
+        st.caption(f"Showing instances {start + 1:,}–{min(start + _TABLE_PAGE_SIZE, total_instances):,} of {total_instances:,}.")
+    table = _inventory_table(filtered, start)
     st.dataframe(
         table,
         use_container_width=True,
@@ -1,12 +1,21 @@
 # Optimization > Containers (Fargate) tab
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from cwt_ui.components.ui.overview_cards import render_sec_card
 from cwt_ui.utils.money import format_usd
 
+# Cost columns shown only when the scan provided them: (source column, table label)
+_OPTIONAL_TABLE_COLUMNS = (
+    ("monthly_cost_usd", "Monthly Cost ($)"),
+    ("billing_type", "Billing Type"),
+    ("recommendation", "Recommendation"),
+    ("potential_savings_usd", "Potential Savings ($)"),
+)
+
 
 def render_fargate_tab() -> None:
     fargate_df = st.session_state.get("fargate_df", pd.DataFrame())
@@ -26,20 +35,21 @@ def render_fargate_tab() -> None:
         selected_statuses = st.multiselect("Status", options=statuses, default=statuses, key="fargate_tab_statuses")
     with col4:
         search_query = st.text_input("Search", value="", max_chars=60, key="fargate_tab_search")
-    filtered = fargate_df.copy()
+    # One combined mask and a single indexing step; no upfront copy of the frame
+    mask = np.ones(len(fargate_df), dtype=bool)
     if selected_regions:
-        filtered = filtered[filtered["region"].isin(selected_regions)]
+        mask &= fargate_df["region"].isin(selected_regions).to_numpy()
     if selected_clusters:
-        filtered = filtered[filtered["cluster_name"].isin(selected_clusters)]
+        mask &= fargate_df["cluster_name"].isin(selected_clusters).to_numpy()
     if selected_statuses:
-        filtered = filtered[filtered["status"].isin(selected_statuses)]
+        mask &= fargate_df["status"].isin(selected_statuses).to_numpy()
     if search_query:
-        q = search_query.lower()
-        filtered = filtered[
-            filtered["service_name"].str.lower().str.contains(q, na=False)
-            | filtered["task_definition_family"].str.lower().str.contains(q, na=False)
-            | filtered["cluster_name"].str.lower().str.contains(q, na=False)
-        ]
+        mask &= (
+            fargate_df["service_name"].str.contains(search_query, case=False, regex=False, na=False)
+            | fargate_df["task_definition_family"].str.contains(search_query, case=False, regex=False, na=False)
+            | fargate_df["cluster_name"].str.contains(search_query, case=False, regex=False, na=False)
+        ).to_numpy()
+    filtered = fargate_df[mask]
     if filtered.empty:
         st.warning("No Fargate tasks match your current filters.")
         return
@@ -65,18 +75,31 @@ def render_fargate_tab() -> None:
     with kpi_col5:
         render_sec_card("Potential Savings", format_usd(potential_savings), "From rightsizing recommendations.")
     st.markdown("#### Fargate Tasks Inventory")
-    base_cols = ["service_name", "cluster_name", "task_definition_family", "region", "cpu", "memory_mb", "platform_version", "status", "started_at"]
-    extra_cols = [c for c in ["monthly_cost_usd", "billing_type", "recommendation", "potential_savings_usd"] if c in filtered.columns]
-    table_df = filtered[base_cols + extra_cols].copy()
-    table_df.columns = ["Service Name", "Cluster", "Task Definition", "Region", "CPU", "Memory (MB)", "Platform Version", "Status", "Started At"] + (
-        ["Monthly Cost ($)", "Billing Type", "Recommendation", "Potential Savings ($)"] if extra_cols else []
-    )
-    if "Started At" in table_df.columns:
-        table_df["Started At"] = pd.to_datetime(table_df["Started At"], errors="coerce").dt.strftime("%Y-%m-%d %H:%M:%S")
-        table_df["Started At"] = table_df["Started At"].fillna("—")
-    col_config = {}
+    # Build the table in one pass with its final names and order (no copy, rename or reorder afterwards)
+    columns = {
+        "Service Name": filtered["service_name"],
+        "Cluster": filtered["cluster_name"],
+        "Task Definition": filtered["task_definition_family"],
+        "Region": filtered["region"],
+        # Scanner CPU is a unit string ("1024" = 1 vCPU); convert once and let column_config format it
+        "CPU": pd.to_numeric(filtered["cpu"], errors="coerce").div(1024).where(lambda v: v > 0),
+        "Memory (MB)": filtered["memory_mb"],
+        "Platform Version": filtered["platform_version"],
+        "Status": filtered["status"],
+        # Keep a real datetime column; DatetimeColumn formats it and leaves NaT blank
+        "Started At": pd.to_datetime(filtered["started_at"], errors="coerce"),
+    }
+    for src_col, label in _OPTIONAL_TABLE_COLUMNS:
+        if src_col in filtered.columns:
+            columns[label] = filtered[src_col]
+    table_df = pd.DataFrame(columns)
+    col_config = {
+        "CPU": st.column_config.NumberColumn("CPU", format="%.2f vCPU"),
+        "Memory (MB)": st.column_config.NumberColumn("Memory (MB)", format="%d MB"),
+        "Started At": st.column_config.DatetimeColumn("Started At", format="YYYY-MM-DD HH:mm:ss"),
+    }
     if "Monthly Cost ($)" in table_df.columns:
         col_config["Monthly Cost ($)"] = st.column_config.NumberColumn("Monthly Cost ($)", format="$%.2f")
     if "Potential Savings ($)" in table_df.columns:
         col_config["Potential Savings ($)"] = st.column_config.NumberColumn("Potential Savings ($)", format="$%.2f")
-    st.dataframe(table_df, use_container_width=True, hide_index=True, column_config=col_config or None)
+    st.dataframe(table_df, use_container_width=True, hide_index=True, column_config=col_config)
@@ -1,52 +1,111 @@
 # Optimization > Serverless (Lambda) tab
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from cwt_ui.components.ui.overview_cards import render_sec_card
 from cwt_ui.utils.money import format_usd
 
+# Session-state slot for (lambda_df, region options, runtime options)
+_OPTIONS_KEY = "_lambda_tab_options"
+
+# Inventory table: source column -> label, in display order (cost columns only when the scan provided them)
+_TABLE_COLUMNS = {
+    "function_name": "Function Name",
+    "region": "Region",
+    "runtime": "Runtime",
+    "memory_size_mb": "Memory Size (MB)",
+    "timeout_seconds": "Timeout (seconds)",
+    "last_modified": "Last Modified",
+    "monthly_cost_usd": "Monthly Cost ($)",
+    "billing_type": "Billing Type",
+    "recommendation": "Recommendation",
+    "potential_savings_usd": "Potential Savings ($)",
+}
+
+
+def _sorted_options(values: pd.Series) -> list[str]:
+    """Distinct non-null values, sorted. Scans store region/runtime as categoricals whose
+    categories already are exactly that; other frames fall back to a unique+sort."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.categories.tolist()
+    return sorted(values.dropna().unique().tolist())
+
+
+def _filter_options(lambda_df: pd.DataFrame) -> tuple[list[str], list[str]]:
+    """Sorted region/runtime options for the session's lambda_df, reused until a scan stores a new frame.
+
+    Keyed by object identity like the EC2 tab's normalized frame, so reruns skip the unique+sort scans.
+    """
+    cached = st.session_state.get(_OPTIONS_KEY)
+    if cached is not None and cached[0] is lambda_df:
+        return cached[1], cached[2]
+    regions = _sorted_options(lambda_df["region"])
+    runtimes = _sorted_options(lambda_df["runtime"])
+    st.session_state[_OPTIONS_KEY] = (lambda_df, regions, runtimes)
+    return regions, runtimes
+
 
 def render_lambda_tab() -> None:
     lambda_df = st.session_state.get("lambda_df", pd.DataFrame())
     if lambda_df is None or lambda_df.empty:
         st.info("Run a scan from **Setup** or load **synthetic data** from Overview to load Lambda function data.")
         return
+    _render_filtered_view(lambda_df)
+
+
+def _lambda_kpis(filtered: pd.DataFrame) -> tuple[int, int, float, float, float]:
+    """(function count, region count, monthly spend, % SP-covered, potential savings).
+
+    region is categorical (scan and synthetic data), so the distinct count works on integer codes.
+    billing_type is only present, and categorical, in synthetic data; there the "SP" match runs
+    per category rather than per row.
+    """
+    total_functions = len(filtered)
+    monthly_spend = float(filtered["monthly_cost_usd"].sum()) if "monthly_cost_usd" in filtered.columns else 0.0
+    if "billing_type" in filtered.columns and filtered["billing_type"].notna().any():
+        covered = filtered["billing_type"].str.contains("SP", case=False, na=False)
+        coverage_pct = (covered.sum() / total_functions) * 100 if total_functions else 0.0
+    else:
+        coverage_pct = 0.0
+    potential_savings = float(filtered["potential_savings_usd"].sum()) if "potential_savings_usd" in filtered.columns else 0.0
+    return total_functions, filtered["region"].nunique(), monthly_spend, float(coverage_pct), potential_savings
+
+
+@st.fragment
+def _render_filtered_view(lambda_df: pd.DataFrame) -> None:
+    """Filters, KPIs and inventory table. Filter edits and search keystrokes rerun only this
+    fragment, not the Optimization page header and the other tabs."""
+    regions, runtimes = _filter_options(lambda_df)
     st.markdown("#### Filters")
     col1, col2, col3 = st.columns([1, 1, 1])
     with col1:
-        regions = sorted(lambda_df["region"].dropna().unique().tolist())
         selected_regions = st.multiselect("Region", options=regions, default=regions, key="lambda_tab_regions")
     with col2:
-        runtimes = sorted(lambda_df["runtime"].dropna().unique().tolist())
         selected_runtimes = st.multiselect("Runtime", options=runtimes, default=runtimes, key="lambda_tab_runtimes")
     with col3:
         search_query = st.text_input("Search", value="", max_chars=60, key="lambda_tab_search")
-    filtered = lambda_df.copy()
-    if selected_regions:
-        filtered = filtered[filtered["region"].isin(selected_regions)]
-    if selected_runtimes:
-        filtered = filtered[filtered["runtime"].isin(selected_runtimes)]
+    # One combined mask and a single indexing step; no upfront copy of the frame. The multiselects
+    # default to every option, so an isin only runs once the user has narrowed one of them
+    mask = np.ones(len(lambda_df), dtype=bool)
+    if selected_regions and len(selected_regions) < len(regions):
+        mask &= lambda_df["region"].isin(selected_regions).to_numpy()
+    if selected_runtimes and len(selected_runtimes) < len(runtimes):
+        mask &= lambda_df["runtime"].isin(selected_runtimes).to_numpy()
     if search_query:
-        q = search_query.lower()
-        filtered = filtered[filtered["function_name"].str.lower().str.contains(q, na=False)]
+        mask &= lambda_df["function_name"].str.contains(search_query, case=False, regex=False, na=False).to_numpy()
+    filtered = lambda_df if mask.all() else lambda_df[mask]
     if filtered.empty:
         st.warning("No Lambda functions match your current filters.")
         return
-    total_functions = len(filtered)
-    monthly_spend = filtered["monthly_cost_usd"].sum() if "monthly_cost_usd" in filtered.columns else 0.0
-    if "billing_type" in filtered.columns and filtered["billing_type"].notna().any():
-        covered = filtered["billing_type"].str.contains("SP", case=False, na=False)
-        coverage_pct = (covered.sum() / total_functions) * 100 if total_functions else 0.0
-    else:
-        coverage_pct = 0.0
-    potential_savings = filtered["potential_savings_usd"].sum() if "potential_savings_usd" in filtered.columns else 0.0
+    total_functions, region_count, monthly_spend, coverage_pct, potential_savings = _lambda_kpis(filtered)
     kpi_col1, kpi_col2, kpi_col3, kpi_col4, kpi_col5 = st.columns(5)
     with kpi_col1:
         render_sec_card("Total Functions", f"{total_functions:,}", "Lambda functions after filters.")
     with kpi_col2:
-        render_sec_card("Regions", filtered["region"].nunique(), "Regions with functions.")
+        render_sec_card("Regions", region_count, "Regions with functions.")
     with kpi_col3:
         render_sec_card("Monthly Spend", format_usd(monthly_spend), "Approximate monthly cost.")
     with kpi_col4:
@@ -54,18 +113,12 @@ def render_lambda_tab() -> None:
     with kpi_col5:
         render_sec_card("Potential Savings", format_usd(potential_savings), "From rightsizing recommendations.")
     st.markdown("#### Lambda Functions Inventory")
-    base_cols = ["function_name", "region", "runtime", "memory_size_mb", "timeout_seconds", "last_modified"]
-    extra_cols = [c for c in ["monthly_cost_usd", "billing_type", "recommendation", "potential_savings_usd"] if c in filtered.columns]
-    table_df = filtered[base_cols + extra_cols].copy()
-    table_df.columns = ["Function Name", "Region", "Runtime", "Memory Size (MB)", "Timeout (seconds)", "Last Modified"] + (
-        ["Monthly Cost ($)", "Billing Type", "Recommendation", "Potential Savings ($)"] if extra_cols else []
-    )
-    if "Last Modified" in table_df.columns:
-        table_df["Last Modified"] = pd.to_datetime(table_df["Last Modified"], errors="coerce").dt.strftime("%Y-%m-%d %H:%M:%S")
-        table_df["Last Modified"] = table_df["Last Modified"].fillna("—")
-    col_config = {}
+    # Select and relabel in one step; nothing below mutates the table, so it needs no copy
+    table_df = filtered[[c for c in _TABLE_COLUMNS if c in filtered.columns]].rename(columns=_TABLE_COLUMNS)
+    # last_modified is parsed when the frame is stored; DatetimeColumn formats it in the browser and leaves NaT blank
+    col_config = {"Last Modified": st.column_config.DatetimeColumn("Last Modified", format="YYYY-MM-DD HH:mm:ss")}
     if "Monthly Cost ($)" in table_df.columns:
         col_config["Monthly Cost ($)"] = st.column_config.NumberColumn("Monthly Cost ($)", format="$%.2f")
     if "Potential Savings ($)" in table_df.columns:
         col_config["Potential Savings ($)"] = st.column_config.NumberColumn("Potential Savings ($)", format="$%.2f")
-    st.dataframe(table_df, use_container_width=True, hide_index=True, column_config=col_config or None)
+    st.dataframe(table_df, use_container_width=True, hide_index=True, column_config=col_config)
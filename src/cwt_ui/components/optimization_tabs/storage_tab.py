@@ -7,6 +7,27 @@ import streamlit as st
 from cwt_ui.components.ui.overview_cards import render_sec_card
 from cwt_ui.utils.money import format_usd
 
+# Session-state slot for (storage_df, region options, storage-class options, recommendation count)
+_SUMMARY_KEY = "_storage_tab_summary"
+# Rows in the default bucket table
+_TOP_BUCKETS = 200
+
+
+def _storage_summary(storage_df: pd.DataFrame) -> tuple[list[str], list[str], int]:
+    """Filter options and the bucket recommendation count for the session's storage_df.
+
+    Reused until a new frame is stored (identity memo, as in the Lambda tab), so widget reruns skip
+    the unique+sort and savings scans.
+    """
+    cached = st.session_state.get(_SUMMARY_KEY)
+    if cached is not None and cached[0] is storage_df:
+        return cached[1:]
+    regions = sorted(storage_df["region"].dropna().unique().tolist())
+    storage_classes = sorted(storage_df["storage_class"].dropna().unique().tolist())
+    action_count = int((storage_df["potential_savings_usd"] > 0).sum())
+    st.session_state[_SUMMARY_KEY] = (storage_df, regions, storage_classes, action_count)
+    return regions, storage_classes, action_count
+
 
 def render_storage_tab() -> None:
     storage_df = st.session_state.get("storage_df", pd.DataFrame())
@@ -17,12 +38,8 @@ def render_storage_tab() -> None:
         else:
             st.info("**Storage (S3)** optimization requires Cost Explorer or CUR data. Load **synthetic data** from Overview to explore this tab.")
         return
-    total_cost = storage_df["monthly_cost_usd"].sum()
-    total_savings = storage_df["potential_savings_usd"].sum()
-    action_count = (storage_df["potential_savings_usd"] > 0).sum()
+    regions, storage_classes, action_count = _storage_summary(storage_df)
     st.markdown("#### Filters")
-    regions = sorted(storage_df["region"].dropna().unique().tolist())
-    storage_classes = sorted(storage_df["storage_class"].dropna().unique().tolist())
     col1, col2 = st.columns(2)
     with col1:
         selected_regions = st.multiselect("Region", options=regions, default=regions, key="storage_tab_regions")
@@ -40,10 +57,21 @@ def render_storage_tab() -> None:
     with kpi_col3:
         render_sec_card("Recommendations", action_count, "Buckets with optimization suggestions.")
     st.markdown("#### S3 buckets")
+    # Send only the top buckets by savings unless asked for all: a collapsed expander would still
+    # serialize the full table, so the full view sits behind a toggle instead
+    if len(filtered) > _TOP_BUCKETS and not st.toggle(f"Show all {len(filtered):,} buckets", key="storage_tab_show_all"):
+        st.caption(f"Showing the {_TOP_BUCKETS} buckets with the highest potential savings.")
+        filtered = filtered.nlargest(_TOP_BUCKETS, "potential_savings_usd")
     display_df = filtered[["bucket_name", "region", "storage_class", "size_gb", "monthly_cost_usd", "recommendation", "potential_savings_usd"]].copy()
     display_df.columns = ["Bucket", "Region", "Storage class", "Size (GB)", "Monthly cost", "Recommendation", "Potential savings"]
-    display_df["Monthly cost"] = display_df["Monthly cost"].apply(lambda x: format_usd(x))
-    display_df["Potential savings"] = display_df["Potential savings"].apply(lambda x: format_usd(x))
-    st.dataframe(display_df, use_container_width=True, hide_index=True)
+    st.dataframe(
+        display_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Monthly cost": st.column_config.NumberColumn("Monthly cost", format="dollar"),
+            "Potential savings": st.column_config.NumberColumn("Potential savings", format="dollar"),
+        },
+    )
     if data_source == "synthetic":
         st.caption("Synthetic data. Real S3 optimization requires Cost Explorer or CUR with storage breakdown.")
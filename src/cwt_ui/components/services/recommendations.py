@@ -8,26 +8,50 @@ import streamlit as st
 import pandas as pd
 from typing import List, Dict, Optional
 
+# Fallbacks for EC2 columns a scan may omit or leave empty (mirrors the old row.get defaults)
+_EC2_DEFAULTS = {
+    "name": "Unnamed",
+    "instance_id": "",
+    "priority": "MEDIUM",
+    "monthly_cost_usd": 0,
+    "potential_savings_usd": 0,
+    "recommendation": "",
+    "avg_cpu_7d": 0,
+    "instance_type": "",
+}
+
+
 def render_recommendations_summary(ec2_df: pd.DataFrame, formatters) -> None:
     """Render a summary of recommendations with implementation steps."""
     
     # Collect all actionable recommendations
     recommendations = []
     
-    # Process EC2 recommendations
+    # Process EC2 recommendations: one vectorized "not OK" mask, then a zip over the columns
+    # instead of iterrows (which boxes every cell of every row)
     if ec2_df is not None and not ec2_df.empty:
-        for _, row in ec2_df.iterrows():
-            if row.get("recommendation", "").upper() != "OK":
-                recommendations.append({
-                    "type": "EC2 Instance",
-                    "resource": f"{row.get('name', 'Unnamed')} ({row.get('instance_id', '')})",
-                    "priority": row.get("priority", "MEDIUM"),
-                    "monthly_cost": row.get("monthly_cost_usd", 0),
-                    "potential_savings": row.get("potential_savings_usd", 0),
-                    "action": row.get("action", row.get("recommendation", "")),
-                    "implementation_steps": row.get("implementation_steps", []),
-                    "details": f"CPU: {row.get('avg_cpu_7d', 0):.1f}% | Type: {row.get('instance_type', '')}"
-                })
+        frame = ec2_df.reindex(columns=[*_EC2_DEFAULTS, "action", "implementation_steps"]).fillna(_EC2_DEFAULTS)
+        frame = frame[frame["recommendation"].astype(str).str.upper() != "OK"]
+        actions = frame["action"].where(frame["action"].notna(), frame["recommendation"])
+        # Normalize priority case once for the whole column instead of per recommendation
+        priorities = frame["priority"].astype(str).str.upper()
+        recommendations = [
+            {
+                "type": "EC2 Instance",
+                "resource": f"{name} ({instance_id})",
+                "priority": priority,
+                "monthly_cost": monthly_cost,
+                "potential_savings": savings,
+                "action": action,
+                "implementation_steps": steps if isinstance(steps, list) else [],
+                "details": f"CPU: {cpu:.1f}% | Type: {instance_type}",
+            }
+            for name, instance_id, priority, monthly_cost, savings, action, steps, cpu, instance_type in zip(
+                frame["name"], frame["instance_id"], priorities, frame["monthly_cost_usd"],
+                frame["potential_savings_usd"], actions, frame["implementation_steps"],
+                frame["avg_cpu_7d"], frame["instance_type"],
+            )
+        ]
     
     if not recommendations:
         st.info("🎉 Great! No optimization recommendations found. Your AWS resources are well-optimized.")
@@ -42,15 +66,17 @@ def render_recommendations_summary(ec2_df: pd.DataFrame, formatters) -> None:
     total_savings = sum(r["potential_savings"] for r in recommendations)
     st.success(f"**Total Potential Savings: {formatters.currency(total_savings)}/month** ({formatters.currency(total_savings * 12)}/year)")
     
-    # Group by priority
-    high_priority = [r for r in recommendations if r["priority"] == "HIGH"]
-    medium_priority = [r for r in recommendations if r["priority"] == "MEDIUM"]
-    low_priority = [r for r in recommendations if r["priority"] == "LOW"]
+    # Group by priority in one pass (dict lookup per recommendation; unknown priorities are not shown)
+    by_priority = {"HIGH": [], "MEDIUM": [], "LOW": []}
+    for rec in recommendations:
+        group = by_priority.get(rec["priority"])
+        if group is not None:
+            group.append(rec)
     
     for priority_group, title, color in [
-        (high_priority, "🔴 High Priority", "error"),
-        (medium_priority, "🟡 Medium Priority", "warning"),
-        (low_priority, "🟢 Low Priority", "success")
+        (by_priority["HIGH"], "🔴 High Priority", "error"),
+        (by_priority["MEDIUM"], "🟡 Medium Priority", "warning"),
+        (by_priority["LOW"], "🟢 Low Priority", "success")
     ]:
         if priority_group:
             st.markdown(f"### {title}")
@@ -61,10 +87,13 @@ def render_recommendations_summary(ec2_df: pd.DataFrame, formatters) -> None:
                     col1, col2 = st.columns([2, 1])
                     
                     with col1:
-                        st.write(f"**Action:** {rec['action']}")
-                        st.write(f"**Details:** {rec['details']}")
-                        st.write(f"**Current Cost:** {formatters.currency(rec['monthly_cost'])}/month")
-                        st.write(f"**Potential Savings:** {formatters.currency(rec['potential_savings'])}/month")
+                        # One markdown element instead of four separate writes
+                        st.markdown(
+                            f"**Action:** {rec['action']}  \n"
+                            f"**Details:** {rec['details']}  \n"
+                            f"**Current Cost:** {formatters.currency(rec['monthly_cost'])}/month  \n"
+                            f"**Potential Savings:** {formatters.currency(rec['potential_savings'])}/month"
+                        )
                     
                     with col2:
                         if rec['potential_savings'] > 0:
@@ -73,9 +102,7 @@ def render_recommendations_summary(ec2_df: pd.DataFrame, formatters) -> None:
                     
                     # Implementation steps
                     if rec['implementation_steps']:
-                        st.markdown("**Implementation Steps:**")
-                        for step in rec['implementation_steps']:
-                            st.write(f"• {step}")
+                        st.markdown("**Implementation Steps:**\n" + "".join(f"\n- {step}" for step in rec['implementation_steps']))
                     else:
                         st.info("Implementation steps will be provided in the detailed view.")
                     
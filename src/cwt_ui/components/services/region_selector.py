@@ -89,11 +89,13 @@ def render_region_selector(
         current_region = st.session_state.get("scan_regions", ["us-east-1"])[0] if st.session_state.get("scan_regions") else "us-east-1"
         
         region_options = {_get_region_name(r): r for r in available_regions}
+        # Reverse map region -> option index for an O(1) lookup of the current selection
+        region_index = {r: i for i, r in enumerate(region_options.values())}
         
         selected_display = st.selectbox(
             "📍 Select Region",
             options=list(region_options.keys()),
-            index=list(region_options.values()).index(current_region) if current_region in region_options.values() else 0,
+            index=region_index.get(current_region, 0),
             key="single_region_select"
         )
         
@@ -106,11 +108,12 @@ def render_region_selector(
         current_selected = st.session_state.get("scan_regions", ["us-east-1"])
         
         region_options = {_get_region_name(r): r for r in available_regions}
+        option_regions = set(region_options.values())
         
         selected_displays = st.multiselect(
             "📍📍 Select Regions (can choose multiple)",
             options=list(region_options.keys()),
-            default=[_get_region_name(r) for r in current_selected if r in region_options.values()],
+            default=[_get_region_name(r) for r in current_selected if r in option_regions],
             key="multi_region_select"
         )
         
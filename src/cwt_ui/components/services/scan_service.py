@@ -5,65 +5,200 @@ Handles the actual scanning functionality and updates session state.
 
 import streamlit as st
 import pandas as pd
+import boto3
 import os
+import traceback
+from datetime import datetime, timedelta, timezone
 from typing import Tuple, Optional, Dict, Any, List
 
-from cwt_ui.services.scans import fetch_savings_plan_utilization
+from core.services.region_service import _common_regions, discover_enabled_regions
+from cwt_ui.services.scans import (
+    _assume_role,
+    _get_session,
+    _temporary_env,
+    fetch_savings_plan_utilization,
+)
+from cwt_ui.services.spend_aggregate import get_optimization_metrics, get_spend_from_scan
+from cwt_ui.components.services.region_selector import render_region_selector
 
+# Resolve the scans adapter once at import instead of on every scan click
+try:
+    from cwt_ui.services.enhanced_scans import run_all_scans
+except ImportError:
+    from cwt_ui.services.scans import run_all_scans
 
-def _scan_lambda_functions(region: Optional[str] | List[str] | None, ec2_df: pd.DataFrame) -> None:
+# Optional scanners, resolved once at import; a missing one is reported when its scan runs
+try:
+    from scanners.lambda_scanner import scan_lambda_functions
+except ImportError:
+    scan_lambda_functions = None
+try:
+    from scanners.fargate_scanner import scan_fargate_tasks
+except ImportError:
+    scan_fargate_tasks = None
+try:
+    from scanners.ec2_sp_alignment_scanner import scan_ec2_sp_alignment
+except ImportError:
+    scan_ec2_sp_alignment = None
+
+# Scan debug prints are on outside production (same switch as cwt_ui.services.scans)
+_DEBUG = os.getenv("APP_ENV", "development").strip().lower() != "production"
+
+# Fallback region when none is set in session state
+_DEFAULT_REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
+
+# Session-state keys for temporary role credentials and the boto3 Session built from them
+# (both also cleared by the Settings role form), and how long before expiry to refresh them
+ASSUMED_ROLE_CACHE_KEY = "_assumed_role_cache"
+BOTO3_SESSION_CACHE_KEY = "_boto3_session_cache"
+_ROLE_REFRESH_MARGIN = timedelta(seconds=60)
+
+# Scan result messages
+_MSG_SCAN_REGIONS = "✅ Scan complete! Found resources in {} regions: {}"
+_MSG_SCAN_REGION = "✅ Scan complete for {}!"
+_MSG_SCAN_DISCOVERED = "✅ Scan complete! Discovered and scanned {} regions: {}"
+_MSG_SCAN_DONE = "✅ Scan complete!"
+
+
+def _assume_role_cached(aws_credentials: Dict[str, str]) -> Optional[Dict[str, str]]:
+    """Assume the IAM role, reusing earlier temporary credentials until shortly before they expire.
+
+    Avoids an STS round-trip on every scan click. Entries are keyed by role, external ID,
+    session name, region, and base access key, so changing any of them assumes the role again.
+    """
+    key = (
+        aws_credentials.get("AWS_ROLE_ARN", ""),
+        aws_credentials.get("AWS_EXTERNAL_ID", ""),
+        aws_credentials.get("AWS_ROLE_SESSION_NAME", ""),
+        aws_credentials.get("AWS_DEFAULT_REGION", ""),
+        aws_credentials.get("AWS_ACCESS_KEY_ID") or os.getenv("AWS_ACCESS_KEY_ID", ""),
+    )
+    cache = st.session_state.setdefault(ASSUMED_ROLE_CACHE_KEY, {})
+    cached = cache.get(key)
+    now = datetime.now(timezone.utc)
+    if cached is not None and cached[1] - now > _ROLE_REFRESH_MARGIN:
+        return cached[0]
+
+    role_creds = _assume_role(aws_credentials)
+    if role_creds:
+        try:
+            expiry = datetime.fromisoformat(role_creds["AWS_CREDENTIAL_EXPIRATION"])
+        except (KeyError, TypeError, ValueError):
+            expiry = now  # Unknown expiry: don't reuse
+        cache[key] = (role_creds, expiry)
+    else:
+        cache.pop(key, None)
+    return role_creds
+
+
+def _session_cached(creds: Dict[str, str]) -> boto3.Session:
+    """Reuse this user's boto3 Session while the credentials are unchanged.
+
+    Kept in session state rather than a process-wide cache so Sessions (which are not
+    thread-safe) and the keys they were built from are never shared across users.
+    """
+    key = (
+        creds.get("AWS_ACCESS_KEY_ID", ""),
+        creds.get("AWS_SECRET_ACCESS_KEY", ""),
+        creds.get("AWS_SESSION_TOKEN", "") or "",
+        creds.get("AWS_DEFAULT_REGION") or "us-east-1",
+    )
+    cached = st.session_state.get(BOTO3_SESSION_CACHE_KEY)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    session = _get_session(*key)
+    st.session_state[BOTO3_SESSION_CACHE_KEY] = (key, session)
+    return session
+
+
+def _store_scan_results(
+    ec2_df: pd.DataFrame,
+    aws_credentials: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+    """Store a finished EC2 scan, then fetch and store Savings Plans data; returns the SP frame.
+
+    aws_credentials are the scanned account's (role or user keys), so Savings Plans are
+    fetched for that account rather than with whatever is in the environment.
+    """
+    st.session_state["ec2_df"] = ec2_df
+    st.session_state["last_scan_at"] = pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S")
+    st.session_state["data_source"] = "real"
+    sp_df, sp_summary, sp_util_trend, sp_coverage_trend = fetch_savings_plan_utilization(aws_credentials or None)
+    st.session_state["SP_DF"] = sp_df
+    st.session_state["SP_SUMMARY"] = sp_summary
+    st.session_state["SP_UTIL_TREND"] = sp_util_trend
+    st.session_state["SP_COVERAGE_TREND"] = sp_coverage_trend
+    return sp_df
+
+
+def _region_summary(ec2_df: pd.DataFrame) -> List[str]:
+    """Sorted distinct regions in a scan result (one hash-unique pass, no intermediate set)."""
+    if ec2_df.empty or "region" not in ec2_df.columns:
+        return []
+    return sorted(ec2_df["region"].dropna().unique())
+
+
+def _scan_lambda_functions(
+    region: Optional[str] | List[str] | None,
+    ec2_df: pd.DataFrame,
+    aws_session: Optional[boto3.Session] = None,
+) -> None:
     """Helper function to scan Lambda functions and store in session state.
     
     Note: This function expects AWS credentials to be available in the environment
     variables (via _temporary_env context manager or system environment).
     """
     try:
-        import traceback
-        from scanners.lambda_scanner import scan_lambda_functions
+        if scan_lambda_functions is None:
+            raise ImportError("scanners.lambda_scanner is not available")
         
         # Determine regions to scan (reuse logic from EC2 scan)
         if region is None:
             # Extract regions from EC2 results if available
             if not ec2_df.empty and "region" in ec2_df.columns:
                 lambda_regions = sorted(ec2_df["region"].unique().tolist())
-                print(f"DEBUG: Using regions from EC2 scan results: {lambda_regions}")
+                if _DEBUG:
+                    print(f"DEBUG: Using regions from EC2 scan results: {lambda_regions}")
             else:
                 # Fallback: Try to discover enabled regions or use common ones
                 try:
-                    from core.services.region_service import discover_enabled_regions
                     # Try to discover regions (credentials should be in environment)
-                    lambda_regions = discover_enabled_regions(None, "user")
+                    lambda_regions = discover_enabled_regions(None, "user", aws_session)
                     if not lambda_regions:
-                        from core.services.region_service import _common_regions
                         lambda_regions = _common_regions()
-                    print(f"DEBUG: Discovered regions for Lambda scan: {lambda_regions}")
+                    if _DEBUG:
+                        print(f"DEBUG: Discovered regions for Lambda scan: {lambda_regions}")
                 except Exception as e:
-                    print(f"DEBUG: Region discovery failed, using common regions: {e}")
-                    from core.services.region_service import _common_regions
+                    if _DEBUG:
+                        print(f"DEBUG: Region discovery failed, using common regions: {e}")
                     lambda_regions = _common_regions()
         elif isinstance(region, str):
             lambda_regions = [region]
-            print(f"DEBUG: Using specified region for Lambda scan: {lambda_regions}")
+            if _DEBUG:
+                print(f"DEBUG: Using specified region for Lambda scan: {lambda_regions}")
         else:
             lambda_regions = region
-            print(f"DEBUG: Using specified regions for Lambda scan: {lambda_regions}")
+            if _DEBUG:
+                print(f"DEBUG: Using specified regions for Lambda scan: {lambda_regions}")
         
         if not lambda_regions:
             print("Warning: No regions available for Lambda scan")
             st.session_state["lambda_df"] = pd.DataFrame()
             return
         
-        print(f"DEBUG: Starting Lambda scan for regions: {lambda_regions}")
+        if _DEBUG:
+            print(f"DEBUG: Starting Lambda scan for regions: {lambda_regions}")
         
         # Scan Lambda functions (credentials should be in environment)
         all_lambda_findings = []
         for reg in lambda_regions:
             try:
-                # Pass None for credentials - rely on environment variables already set
-                findings = scan_lambda_functions(reg, None)
+                # Reuse the scan session when given, otherwise rely on environment variables already set
+                findings = scan_lambda_functions(reg, None, aws_session)
                 if findings:
                     all_lambda_findings.extend(findings)
-                    print(f"DEBUG: Found {len(findings)} Lambda functions in {reg}")
+                    if _DEBUG:
+                        print(f"DEBUG: Found {len(findings)} Lambda functions in {reg}")
             except Exception as e:
                 error_trace = traceback.format_exc()
                 print(f"ERROR: Failed to scan Lambda functions in {reg}: {e}")
@@ -74,11 +209,19 @@ def _scan_lambda_functions(region: Optional[str] | List[str] | None, ec2_df: pd.
         if all_lambda_findings:
             lambda_df = pd.DataFrame(all_lambda_findings)
             lambda_df = lambda_df.sort_values("function_name").reset_index(drop=True)
+            # Arrow-backed names let the tab's case-insensitive search run in one compute kernel
+            lambda_df["function_name"] = lambda_df["function_name"].astype("string[pyarrow]")
+            # Parse the ISO timestamps once per scan rather than on every rerun of the tab
+            lambda_df["last_modified"] = pd.to_datetime(lambda_df["last_modified"], errors="coerce", utc=True)
+            # Few distinct values; categoricals give the tab its (sorted) filter options without a scan
+            lambda_df = lambda_df.astype({"region": "category", "runtime": "category"})
             st.session_state["lambda_df"] = lambda_df
-            print(f"DEBUG: Lambda scan complete. Total functions: {len(lambda_df)}")
+            if _DEBUG:
+                print(f"DEBUG: Lambda scan complete. Total functions: {len(lambda_df)}")
         else:
-            print("DEBUG: Lambda scan complete but no functions found")
-            print(f"DEBUG: Scanned regions: {lambda_regions}")
+            if _DEBUG:
+                print("DEBUG: Lambda scan complete but no functions found")
+                print(f"DEBUG: Scanned regions: {lambda_regions}")
             # Show warning if no functions found but regions were scanned
             if lambda_regions:
                 st.warning(
@@ -92,7 +235,6 @@ def _scan_lambda_functions(region: Optional[str] | List[str] | None, ec2_df: pd.
             st.session_state["lambda_df"] = pd.DataFrame()
     except Exception as e:
         # Log error but don't fail the scan
-        import traceback
         error_trace = traceback.format_exc()
         print(f"ERROR: Lambda scan failed: {e}")
         print(f"ERROR: Full traceback:\n{error_trace}")
@@ -100,59 +242,67 @@ def _scan_lambda_functions(region: Optional[str] | List[str] | None, ec2_df: pd.
         st.session_state.pop("lambda_df", None)
 
 
-def _scan_fargate_tasks(region: Optional[str] | List[str] | None, ec2_df: pd.DataFrame) -> None:
+def _scan_fargate_tasks(
+    region: Optional[str] | List[str] | None,
+    ec2_df: pd.DataFrame,
+    aws_session: Optional[boto3.Session] = None,
+) -> None:
     """Helper function to scan Fargate tasks and store in session state.
     
     Note: This function expects AWS credentials to be available in the environment
     variables (via _temporary_env context manager or system environment).
     """
     try:
-        import traceback
-        from scanners.fargate_scanner import scan_fargate_tasks
+        if scan_fargate_tasks is None:
+            raise ImportError("scanners.fargate_scanner is not available")
         
         # Determine regions to scan (reuse logic from EC2 scan)
         if region is None:
             # Extract regions from EC2 results if available
             if not ec2_df.empty and "region" in ec2_df.columns:
                 fargate_regions = sorted(ec2_df["region"].unique().tolist())
-                print(f"DEBUG: Using regions from EC2 scan results: {fargate_regions}")
+                if _DEBUG:
+                    print(f"DEBUG: Using regions from EC2 scan results: {fargate_regions}")
             else:
                 # Fallback: Try to discover enabled regions or use common ones
                 try:
-                    from core.services.region_service import discover_enabled_regions
                     # Try to discover regions (credentials should be in environment)
-                    fargate_regions = discover_enabled_regions(None, "user")
+                    fargate_regions = discover_enabled_regions(None, "user", aws_session)
                     if not fargate_regions:
-                        from core.services.region_service import _common_regions
                         fargate_regions = _common_regions()
-                    print(f"DEBUG: Discovered regions for Fargate scan: {fargate_regions}")
+                    if _DEBUG:
+                        print(f"DEBUG: Discovered regions for Fargate scan: {fargate_regions}")
                 except Exception as e:
-                    print(f"DEBUG: Region discovery failed, using common regions: {e}")
-                    from core.services.region_service import _common_regions
+                    if _DEBUG:
+                        print(f"DEBUG: Region discovery failed, using common regions: {e}")
                     fargate_regions = _common_regions()
         elif isinstance(region, str):
             fargate_regions = [region]
-            print(f"DEBUG: Using specified region for Fargate scan: {fargate_regions}")
+            if _DEBUG:
+                print(f"DEBUG: Using specified region for Fargate scan: {fargate_regions}")
         else:
             fargate_regions = region
-            print(f"DEBUG: Using specified regions for Fargate scan: {fargate_regions}")
+            if _DEBUG:
+                print(f"DEBUG: Using specified regions for Fargate scan: {fargate_regions}")
         
         if not fargate_regions:
             print("Warning: No regions available for Fargate scan")
             st.session_state["fargate_df"] = pd.DataFrame()
             return
         
-        print(f"DEBUG: Starting Fargate scan for regions: {fargate_regions}")
+        if _DEBUG:
+            print(f"DEBUG: Starting Fargate scan for regions: {fargate_regions}")
         
         # Scan Fargate tasks (credentials should be in environment)
         all_fargate_findings = []
         for reg in fargate_regions:
             try:
-                # Pass None for credentials - rely on environment variables already set
-                findings = scan_fargate_tasks(reg, None)
+                # Reuse the scan session when given, otherwise rely on environment variables already set
+                findings = scan_fargate_tasks(reg, None, aws_session)
                 if findings:
                     all_fargate_findings.extend(findings)
-                    print(f"DEBUG: Found {len(findings)} Fargate tasks in {reg}")
+                    if _DEBUG:
+                        print(f"DEBUG: Found {len(findings)} Fargate tasks in {reg}")
             except Exception as e:
                 error_trace = traceback.format_exc()
                 print(f"ERROR: Failed to scan Fargate tasks in {reg}: {e}")
@@ -163,11 +313,15 @@ def _scan_fargate_tasks(region: Optional[str] | List[str] | None, ec2_df: pd.Dat
         if all_fargate_findings:
             fargate_df = pd.DataFrame(all_fargate_findings)
             fargate_df = fargate_df.sort_values(["cluster_name", "service_name"]).reset_index(drop=True)
+            # Few distinct values per column; categoricals keep the tab's filters on integer codes
+            fargate_df = fargate_df.astype({"region": "category", "cluster_name": "category", "status": "category"})
             st.session_state["fargate_df"] = fargate_df
-            print(f"DEBUG: Fargate scan complete. Total tasks: {len(fargate_df)}")
+            if _DEBUG:
+                print(f"DEBUG: Fargate scan complete. Total tasks: {len(fargate_df)}")
         else:
-            print("DEBUG: Fargate scan complete but no tasks found")
-            print(f"DEBUG: Scanned regions: {fargate_regions}")
+            if _DEBUG:
+                print("DEBUG: Fargate scan complete but no tasks found")
+                print(f"DEBUG: Scanned regions: {fargate_regions}")
             # Show warning if no tasks found but regions were scanned
             if fargate_regions:
                 st.warning(
@@ -181,7 +335,6 @@ def _scan_fargate_tasks(region: Optional[str] | List[str] | None, ec2_df: pd.Dat
             st.session_state["fargate_df"] = pd.DataFrame()
     except Exception as e:
         # Log error but don't fail the scan
-        import traceback
         error_trace = traceback.format_exc()
         print(f"ERROR: Fargate scan failed: {e}")
         print(f"ERROR: Full traceback:\n{error_trace}")
@@ -217,17 +370,10 @@ def run_aws_scan(region: Optional[str] | List[str] | None = None) -> pd.DataFram
             st.session_state["previous_optimization_potential"] = st.session_state.get("optimization_potential", 0)
             st.session_state["previous_action_count"] = st.session_state.get("action_count", 0)
             try:
-                from cwt_ui.services.spend_aggregate import get_spend_from_scan
                 prev_total, _ = get_spend_from_scan()
                 st.session_state["previous_spend_total"] = float(prev_total or 0)
             except Exception:
                 st.session_state["previous_spend_total"] = None
-            # Import the scans service
-            try:
-                from cwt_ui.services.enhanced_scans import run_all_scans
-            except ImportError:
-                from cwt_ui.services.scans import run_all_scans
-            
             # Prepare AWS credentials
             aws_credentials = {}
             aws_auth_method = st.session_state.get("aws_auth_method", "role")  # Default to role
@@ -240,7 +386,7 @@ def run_aws_scan(region: Optional[str] | List[str] | None = None) -> pd.DataFram
                 elif isinstance(region, str):
                     default_region = region
                 else:
-                    default_region = st.session_state.get("aws_default_region", os.getenv("AWS_DEFAULT_REGION", "us-east-1"))
+                    default_region = st.session_state.get("aws_default_region", _DEFAULT_REGION)
                 
                 # For role-based auth, base credentials come from environment variables
                 if st.session_state.get("aws_auth_method") == "role":
@@ -271,12 +417,10 @@ def run_aws_scan(region: Optional[str] | List[str] | None = None) -> pd.DataFram
                     aws_auth_method = "user"
             
             # Prepare credential context for scanning (needed for both EC2 and Lambda)
-            from cwt_ui.services.scans import _assume_role, _temporary_env
-            
-            # If role-based auth, assume role first to get temporary credentials
+            # If role-based auth, assume role first to get temporary credentials (reused until near expiry)
             final_creds = None
             if aws_auth_method == "role" and aws_credentials and "AWS_ROLE_ARN" in aws_credentials:
-                final_creds = _assume_role(aws_credentials)
+                final_creds = _assume_role_cached(aws_credentials)
                 if not final_creds:
                     st.error(f"Failed to assume IAM role: {aws_credentials.get('AWS_ROLE_ARN', 'Unknown')}")
                     return pd.DataFrame()
@@ -285,31 +429,24 @@ def run_aws_scan(region: Optional[str] | List[str] | None = None) -> pd.DataFram
             
             # Use credential context for all scans
             if final_creds:
+                # Reuse this user's boto3 Session across scans while the credentials hold
+                aws_session = _session_cached(final_creds)
                 with _temporary_env(final_creds):
                     # Run EC2 scan
-                    ec2_df = run_all_scans(region=region, aws_credentials=None, aws_auth_method="user")
-                    
-                    # Update session state
-                    st.session_state["ec2_df"] = ec2_df
-                    st.session_state["last_scan_at"] = pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S")
-                    st.session_state["data_source"] = "real"
-
-                    # Fetch Savings Plans data
-                    sp_df, sp_summary, sp_util_trend, sp_coverage_trend = fetch_savings_plan_utilization(None)
+                    ec2_df = run_all_scans(
+                        region=region, aws_credentials=None, aws_auth_method="user", aws_session=aws_session
+                    )
                     
-                    # Store Savings Plans data
-                    st.session_state["SP_DF"] = sp_df
-                    st.session_state["SP_SUMMARY"] = sp_summary
-                    st.session_state["SP_UTIL_TREND"] = sp_util_trend
-                    st.session_state["SP_COVERAGE_TREND"] = sp_coverage_trend
+                    # Store EC2 results and fetch Savings Plans with the scanned account's credentials
+                    sp_df = _store_scan_results(ec2_df, final_creds)
                     
                     # Scan Lambda functions (within same credential context)
                     with st.spinner("Scanning Lambda functions..."):
-                        _scan_lambda_functions(region, ec2_df)
+                        _scan_lambda_functions(region, ec2_df, aws_session)
                     
                     # Scan Fargate tasks (within same credential context)
                     with st.spinner("Scanning Fargate tasks..."):
-                        _scan_fargate_tasks(region, ec2_df)
+                        _scan_fargate_tasks(region, ec2_df, aws_session)
             else:
                 # Use environment credentials directly
                 # If we have explicit credentials, wrap in context to keep them available for Lambda scan
@@ -318,19 +455,8 @@ def run_aws_scan(region: Optional[str] | List[str] | None = None) -> pd.DataFram
                         # Run EC2 scan
                         ec2_df = run_all_scans(region=region, aws_credentials=None, aws_auth_method="user")
                         
-                        # Update session state
-                        st.session_state["ec2_df"] = ec2_df
-                        st.session_state["last_scan_at"] = pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S")
-                        st.session_state["data_source"] = "real"
-
-                        # Fetch Savings Plans data
-                        sp_df, sp_summary, sp_util_trend, sp_coverage_trend = fetch_savings_plan_utilization(None)
-                        
-                        # Store Savings Plans data
-                        st.session_state["SP_DF"] = sp_df
-                        st.session_state["SP_SUMMARY"] = sp_summary
-                        st.session_state["SP_UTIL_TREND"] = sp_util_trend
-                        st.session_state["SP_COVERAGE_TREND"] = sp_coverage_trend
+                        # Store EC2 results and fetch Savings Plans with the scanned account's credentials
+                        sp_df = _store_scan_results(ec2_df, aws_credentials)
                         
                         # Scan Lambda functions (within same credential context)
                         with st.spinner("Scanning Lambda functions..."):
@@ -340,21 +466,8 @@ def run_aws_scan(region: Optional[str] | List[str] | None = None) -> pd.DataFram
                     # Run EC2 scan
                     ec2_df = run_all_scans(region=region, aws_credentials=aws_credentials, aws_auth_method=aws_auth_method)
                     
-                    # Update session state
-                    st.session_state["ec2_df"] = ec2_df
-                    st.session_state["last_scan_at"] = pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S")
-                    st.session_state["data_source"] = "real"
-
-                    # Fetch Savings Plans data
-                    sp_df, sp_summary, sp_util_trend, sp_coverage_trend = fetch_savings_plan_utilization(
-                        aws_credentials if aws_credentials else None
-                    )
-                    
-                    # Store Savings Plans data
-                    st.session_state["SP_DF"] = sp_df
-                    st.session_state["SP_SUMMARY"] = sp_summary
-                    st.session_state["SP_UTIL_TREND"] = sp_util_trend
-                    st.session_state["SP_COVERAGE_TREND"] = sp_coverage_trend
+                    # Store EC2 results and fetch Savings Plans (environment credentials)
+                    sp_df = _store_scan_results(ec2_df)
                     
                     # Scan Lambda functions (using environment credentials)
                     with st.spinner("Scanning Lambda functions..."):
@@ -369,7 +482,8 @@ def run_aws_scan(region: Optional[str] | List[str] | None = None) -> pd.DataFram
             # Compute EC2 vs SP alignment if both EC2 and SP data exist
             if not ec2_df.empty and not sp_df.empty:
                 try:
-                    from scanners.ec2_sp_alignment_scanner import scan_ec2_sp_alignment
+                    if scan_ec2_sp_alignment is None:
+                        raise ImportError("scanners.ec2_sp_alignment_scanner is not available")
                     alignment_df = scan_ec2_sp_alignment(
                         ec2_df, sp_df, aws_credentials if aws_credentials else None
                     )
@@ -381,7 +495,8 @@ def run_aws_scan(region: Optional[str] | List[str] | None = None) -> pd.DataFram
             elif not ec2_df.empty:
                 # If we have EC2 but no SP, still create alignment (all instances uncovered)
                 try:
-                    from scanners.ec2_sp_alignment_scanner import scan_ec2_sp_alignment
+                    if scan_ec2_sp_alignment is None:
+                        raise ImportError("scanners.ec2_sp_alignment_scanner is not available")
                     alignment_df = scan_ec2_sp_alignment(
                         ec2_df, pd.DataFrame(), aws_credentials if aws_credentials else None
                     )
@@ -393,33 +508,28 @@ def run_aws_scan(region: Optional[str] | List[str] | None = None) -> pd.DataFram
             # Update optimization metrics for Overview "vs last scan"
             _ec2 = st.session_state.get("ec2_df", pd.DataFrame())
             if _ec2 is not None and not _ec2.empty:
-                from cwt_ui.services.spend_aggregate import get_optimization_metrics
                 _opt, _act = get_optimization_metrics(_ec2)
                 st.session_state["optimization_potential"] = _opt
                 st.session_state["action_count"] = _act
 
             # Show success message with region info
             if isinstance(region, list):
-                st.success(f"✅ Scan complete! Found resources in {len(region)} regions: {', '.join(region)}")
+                st.success(_MSG_SCAN_REGIONS.format(len(region), ", ".join(region)))
             elif isinstance(region, str):
-                st.success(f"✅ Scan complete for {region}!")
+                st.success(_MSG_SCAN_REGION.format(region))
             else:
                 # Count unique regions in results
-                regions_scanned = set()
-                if not ec2_df.empty and "region" in ec2_df.columns:
-                    regions_scanned.update(ec2_df["region"].unique())
+                regions_scanned = _region_summary(ec2_df)
                 if regions_scanned:
-                    regions_list = sorted(list(regions_scanned))
-                    st.success(f"✅ Scan complete! Discovered and scanned {len(regions_scanned)} regions: {', '.join(regions_list)}")
+                    st.success(_MSG_SCAN_DISCOVERED.format(len(regions_scanned), ", ".join(regions_scanned)))
                 else:
-                    st.success("✅ Scan complete!")
+                    st.success(_MSG_SCAN_DONE)
             
             return ec2_df
             
         except Exception as e:
             error_msg = str(e)
             st.error(f"❌ Scan failed: {error_msg}")
-            import traceback
             full_traceback = traceback.format_exc()
             print(f"ERROR: Full traceback:\n{full_traceback}")
             # Show exception details to help debug
@@ -438,8 +548,6 @@ def render_scan_button(show_region_selector: bool = True) -> bool:
         True if scan button was clicked
     """
     if show_region_selector:
-        from cwt_ui.components.services.region_selector import render_region_selector
-        
         st.markdown("---")
         st.markdown("### 🔍 Scan Configuration")
         
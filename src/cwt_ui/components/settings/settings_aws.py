@@ -5,8 +5,43 @@ Handles session-only AWS credential configuration with a streamlined UI.
 
 import streamlit as st
 import os
+import re
+from cwt_ui.components.services.scan_service import ASSUMED_ROLE_CACHE_KEY, BOTO3_SESSION_CACHE_KEY
 from .settings_config import SettingsManager
 
+# Long-term (AKIA) or temporary (ASIA) access key IDs; used to reject malformed keys before any STS call
+_AK_RE = re.compile(r"(?:AKIA|ASIA)[0-9A-Z]{16}")
+
+# Role settings dropped by the Clear button; readers fall back to their defaults via .get()
+_ROLE_KEYS_TO_CLEAR = (
+    "aws_override_enabled",
+    "aws_role_arn",
+    "aws_external_id",
+    "aws_role_session_name",
+    ASSUMED_ROLE_CACHE_KEY,
+    BOTO3_SESSION_CACHE_KEY,
+    "_last_scan_click",
+)
+
+
+_BASE_CREDS_WARNINGS = {
+    "missing": "⚠️ **Base credentials not found in environment variables.**\n\nPlease set `AWS_ACCESS_KEY_ID` and `AWS_SECRET_ACCESS_KEY` in your environment before using role assumption.",
+    "malformed": "⚠️ **Base credentials look malformed.** `AWS_ACCESS_KEY_ID` should be 20 characters starting with `AKIA` or `ASIA`, and `AWS_SECRET_ACCESS_KEY` 40 characters.",
+}
+
+
+def _base_creds_status(base_ak: str, base_sk: str) -> str:
+    """Classify env base credentials as "missing", "malformed" or "ok".
+
+    Deliberately uncached: a cache would keep the raw secret key as a key for the process lifetime.
+    """
+    if not base_ak or not base_sk:
+        return "missing"
+    # Raw values: boto3 sends them unstripped, so surrounding whitespace is malformed too
+    if not (_AK_RE.fullmatch(base_ak) and len(base_sk) == 40):
+        return "malformed"
+    return "ok"
+
 
 def render_clean_credentials_form(settings_manager: SettingsManager) -> bool:
     """Render a clean, simple role-based credentials form.
@@ -17,14 +52,10 @@ def render_clean_credentials_form(settings_manager: SettingsManager) -> bool:
     Returns:
         True if credentials were successfully applied, False otherwise
     """
-    cfg = settings_manager.load_settings()
-    
-    # Check if base credentials are in environment
-    base_ak = os.getenv("AWS_ACCESS_KEY_ID")
-    base_sk = os.getenv("AWS_SECRET_ACCESS_KEY")
-    
-    if not base_ak or not base_sk:
-        st.warning("⚠️ **Base credentials not found in environment variables.**\n\nPlease set `AWS_ACCESS_KEY_ID` and `AWS_SECRET_ACCESS_KEY` in your environment before using role assumption.")
+    # Check base credentials in environment (a length test and one regex; cheap every rerun)
+    base_status = _base_creds_status(os.getenv("AWS_ACCESS_KEY_ID", ""), os.getenv("AWS_SECRET_ACCESS_KEY", ""))
+    if base_status != "ok":
+        st.warning(_BASE_CREDS_WARNINGS[base_status])
     
     # Create a simple form for role assumption - GLOBAL SCAN (no region input)
     with st.form("aws_credentials_form", clear_on_submit=False):
@@ -79,10 +110,14 @@ def render_clean_credentials_form(settings_manager: SettingsManager) -> bool:
         session_name = session_name.strip() or "CloudWasteTracker"
         
         # Check base credentials first
-        if not base_ak or not base_sk:
+        if base_status == "missing":
             st.error("❌ **Base credentials missing.** Please set `AWS_ACCESS_KEY_ID` and `AWS_SECRET_ACCESS_KEY` in your environment variables.")
             return False
         
+        if base_status == "malformed":
+            st.error("❌ **Base credentials malformed.** Check `AWS_ACCESS_KEY_ID` and `AWS_SECRET_ACCESS_KEY` for typos or stray whitespace.")
+            return False
+        
         if not role_arn:
             st.warning("⚠️ Please provide a Role ARN.")
             return False
@@ -95,22 +130,22 @@ def render_clean_credentials_form(settings_manager: SettingsManager) -> bool:
         if not role_arn.startswith("arn:aws:iam::"):
             st.warning("⚠️ Role ARN format appears incorrect. Should start with `arn:aws:iam::`")
         
-        # Store in session state (no region - global scan)
-        st.session_state["aws_override_enabled"] = True
-        st.session_state["aws_role_arn"] = role_arn
-        st.session_state["aws_external_id"] = external_id
-        st.session_state["aws_role_session_name"] = session_name
-        st.session_state["aws_auth_method"] = "role"
-        st.session_state["_credentials_just_applied"] = True
+        # Store in session state in one update (no region - global scan)
+        st.session_state.update({
+            "aws_override_enabled": True,
+            "aws_role_arn": role_arn,
+            "aws_external_id": external_id,
+            "aws_role_session_name": session_name,
+            "aws_auth_method": "role",
+            "_credentials_just_applied": True,
+        })
         
         return True  # Successfully applied
     
     if clear_button:
-        # Clear credentials
-        st.session_state["aws_override_enabled"] = False
-        st.session_state["aws_role_arn"] = ""
-        st.session_state["aws_external_id"] = ""
-        st.session_state["aws_role_session_name"] = "CloudWasteTracker"
+        # Drop the role fields, its temporary credentials, and the boto3 Session built from them
+        for key in _ROLE_KEYS_TO_CLEAR:
+            st.session_state.pop(key, None)
         st.info("ℹ️ Role cleared. Using environment variables directly.")
         return False
     
@@ -5,10 +5,24 @@ Handles loading, saving, and validation of application settings.
 
 import json
 import os
+import re
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import datetime as dt
 
+# Compiled once at import; used by the email-report validation (one-digit hours parse too, as in parse_time).
+_TIME_RE = re.compile(r"\A(?:[01]?\d|2[0-3]):[0-5]\d\Z")
+_EMAIL_RE = re.compile(r"\A[^@\s]+@[^@\s]+\.[^@\s]+\Z")
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Read a small file in one syscall, skipping the text-mode decoder."""
+    fd = os.open(str(path), os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
 
 class SettingsManager:
     """Manages application settings with proper validation and persistence."""
@@ -61,15 +75,14 @@ class SettingsManager:
         """Load settings from file with fallback to defaults."""
         if self.settings_path.exists():
             try:
-                with open(self.settings_path, "r") as f:
-                    settings = json.load(f)
-                    # Merge with defaults to ensure all keys exist
-                    return self._merge_with_defaults(settings)
+                settings = json.loads(_read_bytes(self.settings_path))
+                # Merge with defaults to ensure all keys exist
+                return self._merge_with_defaults(settings)
             except json.JSONDecodeError:
                 print(f"Error reading settings file: {self.settings_path}. Using defaults.")
-                return self.default_settings.copy()
+                return self._copy_defaults()
         
-        return self.default_settings.copy()
+        return self._copy_defaults()
     
     def save_settings(self, settings: Dict[str, Any]) -> bool:
         """Save settings to file."""
@@ -83,7 +96,7 @@ class SettingsManager:
     
     def _merge_with_defaults(self, settings: Dict[str, Any]) -> Dict[str, Any]:
         """Merge loaded settings with defaults to ensure all keys exist."""
-        merged = self.default_settings.copy()
+        merged = self._copy_defaults()
         for key, value in settings.items():
             if isinstance(value, dict) and key in merged:
                 merged[key].update(value)
@@ -91,6 +104,13 @@ class SettingsManager:
                 merged[key] = value
         return merged
     
+    def _copy_defaults(self) -> Dict[str, Any]:
+        """Copy the defaults one level deep (the schema is section -> scalars)."""
+        return {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in self.default_settings.items()
+        }
+    
     def get_setting(self, section: str, key: str, default: Any = None) -> Any:
         """Get a specific setting value."""
         settings = self.load_settings()
@@ -113,6 +133,21 @@ def parse_time(time_str: str) -> dt.time:
         return dt.time(9, 0)  # Default to 09:00
 
 
+def validate_email_reports(email_cfg: Dict[str, Any]) -> List[str]:
+    """Return a list of human-readable issues with the email report settings."""
+    issues: List[str] = []
+    recipient = email_cfg.get("recipient", "")
+    if email_cfg.get("enabled") and not recipient:
+        issues.append("Recipient email is required when email reports are enabled.")
+    elif recipient and not _EMAIL_RE.match(recipient):
+        issues.append(f"Recipient email `{recipient}` is not a valid address.")
+    if email_cfg.get("schedule") not in ("daily", "weekly"):
+        issues.append("Report frequency must be daily or weekly.")
+    if not _TIME_RE.match(email_cfg.get("send_time", "")):
+        issues.append("Send time must use the HH:MM 24-hour format.")
+    return issues
+
+
 def weekday_index(weekday_str: str) -> int:
     """Get weekday index for selectbox."""
     weekdays = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
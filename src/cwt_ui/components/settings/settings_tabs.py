@@ -8,7 +8,10 @@ from ..ui.beautiful_ui import (
     render_section_header, render_settings_card, close_settings_card, 
     render_success_card, render_warning_card, render_info_card
 )
-from .settings_config import SettingsManager, parse_time, weekday_index
+from .settings_config import SettingsManager, parse_time, validate_email_reports, weekday_index
+
+# Default for the debug-mode checkbox, read from the environment once at import
+_DEBUG_MODE_DEFAULT = os.getenv("APP_ENV", "development").strip().lower() != "production"
 
 
 def render_email_notifications_tab(settings_manager: SettingsManager) -> None:
@@ -53,18 +56,24 @@ def render_email_notifications_tab(settings_manager: SettingsManager) -> None:
             )
         
         if st.form_submit_button("💾 Save Email Settings", type="primary", use_container_width=True):
-            # Save email settings
-            if "email_reports" not in cfg:
-                cfg["email_reports"] = {}
-            cfg["email_reports"].update({
+            email_cfg = {
                 "enabled": enabled,
                 "recipient": recipient.strip(),
                 "schedule": schedule,
                 "send_time": send_time.strftime("%H:%M"),
                 "weekday": weekday,
-            })
-            if settings_manager.save_settings(cfg):
-                st.success("✅ Email settings saved successfully!")
+            }
+            issues = validate_email_reports(email_cfg)
+            if issues:
+                for issue in issues:
+                    st.warning(f"⚠️ {issue}")
+            else:
+                # Save email settings
+                if "email_reports" not in cfg:
+                    cfg["email_reports"] = {}
+                cfg["email_reports"].update(email_cfg)
+                if settings_manager.save_settings(cfg):
+                    st.success("✅ Email settings saved successfully!")
     
     close_settings_card()
     
@@ -184,15 +193,11 @@ def render_advanced_tab(settings_manager: SettingsManager) -> None:
     
     cfg = settings_manager.load_settings()
     
-    # Get debug mode from environment
-    APP_ENV = os.getenv("APP_ENV", "development").strip().lower()
-    DEBUG_MODE = APP_ENV != "production"
-    
     with st.form("advanced_form"):
         col1, col2 = st.columns(2)
         
         with col1:
-            debug_mode = st.checkbox("🐛 Enable debug mode", value=DEBUG_MODE)
+            debug_mode = st.checkbox("🐛 Enable debug mode", value=_DEBUG_MODE_DEFAULT)
             st.caption("Show detailed debug information in the interface")
             
             auto_refresh = st.checkbox(
@@ -2,92 +2,148 @@
 from __future__ import annotations
 
 import os
+import time
+from collections import defaultdict
 import streamlit as st
 
+from core.services.region_service import _common_regions, discover_enabled_regions, get_region_display_name
 from cwt_ui.components.settings.settings_config import SettingsManager
 from cwt_ui.components.settings.settings_aws import render_clean_credentials_form
 from cwt_ui.components.services.scan_service import run_aws_scan
 
+_DEFAULT_REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
+# Repeat clicks for the same target within this window reuse the last scan unless
+# "Force refresh" is ticked (a full account scan is the slowest thing the app does)
+_SCAN_REUSE_SECONDS = 300.0
 
-def _debug_write(message: str) -> None:
-    pass
+_SETUP_CSS = """
+<style>
+    .main .block-container { padding-left: 2rem; padding-right: 2rem; padding-top: 2rem; padding-bottom: 2rem; max-width: 900px; }
+    h2 { color: #1f77b4; margin-top: 1.5rem; margin-bottom: 0.5rem; }
+    h3 { color: #495057; margin-top: 2rem; margin-bottom: 1rem; font-weight: 600; }
+    .stButton > button { font-weight: 500; transition: all 0.2s ease; }
+    .stButton > button:enabled:hover { transform: translateY(-1px); box-shadow: 0 4px 8px rgba(0,0,0,0.15); }
+    .scan-mode-container { display: flex; gap: 1rem; margin-bottom: 1.5rem; padding: 1rem; background-color: #f8f9fa; border-radius: 8px; align-items: center; }
+    .scan-mode-option { display: flex; align-items: center; gap: 0.5rem; cursor: pointer; padding: 0.5rem 1rem; border-radius: 20px; transition: all 0.3s ease; font-weight: 500; }
+    .scan-mode-option:hover { background-color: #e9ecef; }
+    .scan-mode-option.active { background-color: #1f77b4; color: white; }
+</style>
+"""
+
+
+_SCAN_MODE_INFO = {
+    "global": "💡 **Global Scan:** Your env vars will be used to assume the IAM role. The scan will discover and iterate all enabled AWS regions.",
+    "regional": "💡 **Regional Scan:** Scan a specific AWS region for faster results.",
+}
+_SCAN_BUTTON_TEXT = {"global": "🌍 Run Global Scan", "regional": "📍 Run Regional Scan ({region})"}
+_SCAN_SPINNER_TEXT = {"global": "Scanning all enabled AWS regions...", "regional": "Scanning..."}
+_STATUS_BOX = "<div style='padding: 0.75rem 1rem; background-color: {}; border-left: 4px solid {}; border-radius: 6px; margin-bottom: 1rem; color: {};'>{}</div>"
+# Step 2 status box keyed by (scan_mode, has_credentials)
+_STATUS_HTML = {
+    ("global", True): _STATUS_BOX.format("#e7f5e7", "#28a745", "#155724", "✅ **Role is configured.** Click below to scan."),
+    ("regional", True): _STATUS_BOX.format("#e7f5e7", "#28a745", "#155724", "✅ **Role is configured.** Click below to scan. Select a region for regional scan."),
+    ("global", False): _STATUS_BOX.format("#f8f9fa", "#6c757d", "#495057", "⏳ **Configure your IAM Role in Step 1** to enable scanning."),
+    ("regional", False): _STATUS_BOX.format("#f8f9fa", "#6c757d", "#495057", "⏳ **Configure your IAM Role in Step 1** to enable scanning."),
+}
+
+
+def _set_scan_mode(mode: str) -> None:
+    st.session_state["scan_mode"] = mode
 
 
 def _render_scan_mode_toggle() -> str:
     if "scan_mode" not in st.session_state:
         st.session_state["scan_mode"] = "regional"
-    st.markdown("""
-    <style>
-        .scan-mode-container { display: flex; gap: 1rem; margin-bottom: 1.5rem; padding: 1rem; background-color: #f8f9fa; border-radius: 8px; align-items: center; }
-        .scan-mode-option { display: flex; align-items: center; gap: 0.5rem; cursor: pointer; padding: 0.5rem 1rem; border-radius: 20px; transition: all 0.3s ease; font-weight: 500; }
-        .scan-mode-option:hover { background-color: #e9ecef; }
-        .scan-mode-option.active { background-color: #1f77b4; color: white; }
-    </style>
-    """, unsafe_allow_html=True)
+    # on_click runs before the click's rerun, so both buttons already render with the new mode
     col1, col2 = st.columns([1, 1])
     with col1:
-        if st.button("📍 Regional Scan", key="regional_scan_toggle", type="primary" if st.session_state["scan_mode"] == "regional" else "secondary", use_container_width=True):
-            st.session_state["scan_mode"] = "regional"
-            st.rerun()
+        st.button("📍 Regional Scan", key="regional_scan_toggle", type="primary" if st.session_state["scan_mode"] == "regional" else "secondary", use_container_width=True, on_click=_set_scan_mode, args=("regional",))
     with col2:
-        if st.button("🌍 Global Scan", key="global_scan_toggle", type="primary" if st.session_state["scan_mode"] == "global" else "secondary", use_container_width=True):
-            st.session_state["scan_mode"] = "global"
-            st.rerun()
+        st.button("🌍 Global Scan", key="global_scan_toggle", type="primary" if st.session_state["scan_mode"] == "global" else "secondary", use_container_width=True, on_click=_set_scan_mode, args=("global",))
     return st.session_state["scan_mode"]
 
 
-def _group_regions_by_area(regions: list[str]) -> dict[str, list[str]]:
-    groups: dict[str, list[str]] = {"USA": [], "Europe": [], "Asia Pacific": [], "Middle East": [], "Africa": [], "South America": [], "Canada": [], "Other": []}
-    for region in regions:
-        if any(region.startswith(p) for p in ["us-"]): groups["USA"].append(region)
-        elif any(region.startswith(p) for p in ["eu-"]): groups["Europe"].append(region)
-        elif any(region.startswith(p) for p in ["ap-", "ap-south"]): groups["Asia Pacific"].append(region)
-        elif any(region.startswith(p) for p in ["me-"]): groups["Middle East"].append(region)
-        elif any(region.startswith(p) for p in ["af-"]): groups["Africa"].append(region)
-        elif any(region.startswith(p) for p in ["sa-"]): groups["South America"].append(region)
-        elif any(region.startswith(p) for p in ["ca-"]): groups["Canada"].append(region)
-        else: groups["Other"].append(region)
-    return {k: sorted(v) for k, v in groups.items() if v}
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_discover_regions(auth_method: str, default_region: str | None, role_arn: str) -> tuple[str, ...]:
+    """Enabled regions for the current credentials, cached for an hour (and the fallback with them).
+
+    cache_data is shared by every session, so the applied role ARN is part of the key: a session
+    on a different role (possibly another account, with other regions) gets its own entry.
+    """
+    aws_credentials = {"AWS_DEFAULT_REGION": default_region} if default_region else None
+    try:
+        available_regions = discover_enabled_regions(aws_credentials, auth_method)
+    except Exception:
+        available_regions = _common_regions()
+    return tuple(available_regions) or ("us-east-1",)
+
+
+_PREFIX_TO_GROUP = {"us": "USA", "eu": "Europe", "ap": "Asia Pacific", "me": "Middle East", "af": "Africa", "sa": "South America", "ca": "Canada"}
+_REGION_GROUP_ORDER = ("USA", "Canada", "Europe", "Asia Pacific", "Middle East", "Africa", "South America", "Other")
+
+
+def _group_regions_by_area(regions: tuple[str, ...]) -> dict[str, list[str]]:
+    """Non-empty region groups in display order, each list sorted."""
+    groups: defaultdict[str, list[str]] = defaultdict(list)
+    # Sort once up front so each group's list is already in order as it's appended
+    for region in sorted(regions):
+        groups[_PREFIX_TO_GROUP.get(region.split("-", 1)[0], "Other")].append(region)
+    return {g: groups[g] for g in _REGION_GROUP_ORDER if g in groups}
+
+
+@st.cache_data(show_spinner=False)
+def _build_region_options(regions: tuple[str, ...]) -> tuple[tuple[str, ...], dict[str, str | None], dict[str, int]]:
+    """Selectbox options with group subheadings, option -> region map, and region -> option index."""
+    ordered_options: list[str] = []
+    region_options: dict[str, str | None] = {}
+    region_index: dict[str, int] = {}
+    for group_name, group_regions in _group_regions_by_area(regions).items():
+        heading = f"━━━ {group_name} ━━━"
+        ordered_options.append(heading)
+        region_options[heading] = None
+        for region in group_regions:
+            opt = f"  └─ {get_region_display_name(region)} ({region})"
+            region_options[opt] = region
+            region_index[region] = len(ordered_options)
+            ordered_options.append(opt)
+    return tuple(ordered_options), region_options, region_index
+
+
+def _snap_off_subheading(ordered_options: tuple[str, ...], region_index: dict[str, int]) -> None:
+    """Group subheadings aren't regions; put the selectbox back on the last real region."""
+    if st.session_state["region_selector"].startswith("━━━"):
+        current_region = st.session_state.get("selected_region")
+        idx = region_index.get(current_region, next(iter(region_index.values()), 0))
+        st.session_state["region_selector"] = ordered_options[idx]
 
 
 def _render_region_selector() -> str | None:
     try:
-        from core.services.region_service import discover_enabled_regions, get_region_display_name
-        aws_credentials = None
+        default_region = None
         if st.session_state.get("aws_override_enabled"):
-            aws_credentials = {"AWS_DEFAULT_REGION": st.session_state.get("aws_default_region", os.getenv("AWS_DEFAULT_REGION", "us-east-1"))}
-        try:
-            available_regions = discover_enabled_regions(aws_credentials, st.session_state.get("aws_auth_method", "role"))
-        except Exception:
-            from core.services.region_service import _common_regions
-            available_regions = _common_regions()
-        if not available_regions:
-            available_regions = ["us-east-1"]
+            default_region = st.session_state.get("aws_default_region", _DEFAULT_REGION)
+        available_regions = _cached_discover_regions(
+            st.session_state.get("aws_auth_method", "role"),
+            default_region,
+            st.session_state.get("aws_role_arn", "") if st.session_state.get("aws_override_enabled") else "",
+        )
         if "selected_region" not in st.session_state:
             st.session_state["selected_region"] = st.session_state.get("aws_default_region", "us-east-1")
-        grouped = _group_regions_by_area(available_regions)
-        region_options: dict[str, str | None] = {}
-        ordered_options: list[str] = []
-        for group_name in ["USA", "Canada", "Europe", "Asia Pacific", "Middle East", "Africa", "South America", "Other"]:
-            if group_name not in grouped or not grouped[group_name]:
-                continue
-            ordered_options.append(f"━━━ {group_name} ━━━")
-            region_options[f"━━━ {group_name} ━━━"] = None
-            for region in grouped[group_name]:
-                opt = f"  └─ {get_region_display_name(region)} ({region})"
-                region_options[opt] = region
-                ordered_options.append(opt)
+        ordered_options, region_options, region_index = _build_region_options(available_regions)
         current_region = st.session_state["selected_region"]
-        current_index = 0
-        option_values = [v for v in region_options.values() if v is not None]
-        for idx, opt in enumerate(ordered_options):
-            if region_options.get(opt) == current_region:
-                current_index = idx
-                break
-        selected_display = st.selectbox("📍 Select AWS Region", options=ordered_options, index=current_index, key="region_selector")
-        if selected_display.startswith("━━━"):
-            selected_region = current_region if current_region in option_values else (option_values[0] if option_values else "us-east-1")
-            st.rerun()
+        current_index = region_index.get(current_region, 0)
+        # Once the widget has state, index is ignored; passing it anyway trips Streamlit's
+        # "default value and Session State" warning after _snap_off_subheading writes the key
+        selected_display = st.selectbox(
+            "📍 Select AWS Region",
+            options=ordered_options,
+            index=None if "region_selector" in st.session_state else current_index,
+            key="region_selector",
+            on_change=_snap_off_subheading,
+            args=(ordered_options, region_index),
+        )
+        if selected_display is None or selected_display.startswith("━━━"):
+            selected_region = current_region if current_region in region_index else next(iter(region_index), "us-east-1")
         else:
             selected_region = region_options[selected_display]
         st.session_state["selected_region"] = selected_region
@@ -97,21 +153,78 @@ def _render_region_selector() -> str | None:
         return "us-east-1"
 
 
+@st.cache_resource
+def _get_settings_manager() -> SettingsManager:
+    return SettingsManager()
+
+
+@st.fragment
+def _render_credentials_fragment(settings_manager: SettingsManager) -> None:
+    """Step 1 role form. Edits and failed submits rerun only this fragment;
+    a successful apply reruns the whole page so Step 2 picks up the new role."""
+    if render_clean_credentials_form(settings_manager):
+        # A new role means a different account view; don't reuse the previous role's scan
+        st.session_state.pop("_last_scan_click", None)
+        st.rerun()
+
+
 def _render_clean_css() -> None:
-    st.markdown("""
-    <style>
-        .main .block-container { padding-left: 2rem; padding-right: 2rem; padding-top: 2rem; padding-bottom: 2rem; max-width: 900px; }
-        h2 { color: #1f77b4; margin-top: 1.5rem; margin-bottom: 0.5rem; }
-        h3 { color: #495057; margin-top: 2rem; margin-bottom: 1rem; font-weight: 600; }
-        .stButton > button { font-weight: 500; transition: all 0.2s ease; }
-        .stButton > button:enabled:hover { transform: translateY(-1px); box-shadow: 0 4px 8px rgba(0,0,0,0.15); }
-    </style>
-    """, unsafe_allow_html=True)
+    # Streamlit drops elements not re-emitted on a rerun, so the CSS must be sent each run;
+    # keep it to a single prebuilt block
+    st.markdown(_SETUP_CSS, unsafe_allow_html=True)
+
+
+@st.fragment
+def _render_scan_step(scan_mode: str) -> None:
+    """Step 2 status, region selector and scan button. Region changes rerun only this
+    fragment, not the CSS, settings load and Step 1 form above it."""
+    has_credentials = st.session_state.get("credentials_applied", False) or st.session_state.get("aws_override_enabled", False)
+    st.markdown(_STATUS_HTML[(scan_mode, has_credentials)], unsafe_allow_html=True)
+    selected_region = _render_region_selector() if scan_mode == "regional" else None
+    if has_credentials:
+        button_text = _SCAN_BUTTON_TEXT[scan_mode].format(region=selected_region)
+        scan_region = selected_region
+        force_refresh = st.checkbox(
+            "Force refresh",
+            key="setup_force_refresh",
+            help="Rescan even if this target was scanned in the last 5 minutes.",
+        )
+        if st.button(button_text, type="primary", use_container_width=True):
+            last_scan = st.session_state.get("_last_scan_click")
+            if (
+                not force_refresh
+                and last_scan
+                and last_scan[1] == scan_region
+                and time.monotonic() - last_scan[0] < _SCAN_REUSE_SECONDS
+            ):
+                st.info("ℹ️ This target was scanned in the last 5 minutes. Showing those results; tick **Force refresh** to rescan.")
+            else:
+                with st.spinner(_SCAN_SPINNER_TEXT[scan_mode]):
+                    try:
+                        ec2_df = run_aws_scan(region=scan_region)
+                        if not ec2_df.empty:
+                            st.session_state["_last_scan_click"] = (time.monotonic(), scan_region)
+                            st.success("✅ **Scan complete!** Found AWS resources.")
+                            st.info(f"📊 Found {len(ec2_df)} EC2 instances.")
+                            st.balloons()
+                        else:
+                            st.warning("⚠️ **Scan completed but no resources found.**")
+                    except Exception as e:
+                        st.error(f"❌ **Scan failed:** {str(e)}")
+                        st.exception(e)
+    else:
+        st.button("Run Scan", type="secondary", use_container_width=True, disabled=True)
+    st.markdown("---")
+    if st.session_state.get("last_scan_at"):
+        st.markdown("### Ready to explore?")
+        if st.button("📊 Go to Overview", type="secondary", use_container_width=True):
+            st.info("💡 Use the sidebar to open **Overview** or **Optimization**.")
 
 
 def render_aws_setup_content() -> None:
     _render_clean_css()
-    settings_manager = SettingsManager()
+    settings_manager = _get_settings_manager()
+    # Read settings.json each run (cheap); a process-wide cache would miss saves from the Settings tabs
     cfg = settings_manager.load_settings()
     st.session_state.setdefault("aws_override_enabled", False)
     st.session_state.setdefault("aws_role_arn", "")
@@ -122,46 +235,20 @@ def render_aws_setup_content() -> None:
     st.session_state.setdefault("credentials_applied", False)
     st.markdown("### Step 1: Configure IAM Role")
     scan_mode = _render_scan_mode_toggle()
-    if scan_mode == "global":
-        st.info("💡 **Global Scan:** Your env vars will be used to assume the IAM role. The scan will discover and iterate all enabled AWS regions.")
+    st.info(_SCAN_MODE_INFO[scan_mode])
+    # Once a role is applied and a scan has run, the form is only built when the user asks to edit it
+    if (
+        st.session_state.get("credentials_applied")
+        and st.session_state.get("last_scan_at")
+        and not st.toggle("Edit IAM role", key="setup_edit_role")
+    ):
+        st.caption(f"Using role `{st.session_state.get('aws_role_arn') or 'from environment'}`.")
     else:
-        st.info("💡 **Regional Scan:** Scan a specific AWS region for faster results.")
-    credentials_applied = render_clean_credentials_form(settings_manager)
+        _render_credentials_fragment(settings_manager)
     if st.session_state.get("_credentials_just_applied", False):
         st.session_state["credentials_applied"] = True
         st.session_state["_credentials_just_applied"] = False
         st.success("✅ **Role configured successfully!** Ready to test connection.")
     st.markdown("---")
     st.markdown("### Step 2: Test AWS Connection")
-    has_credentials = st.session_state.get("credentials_applied", False) or st.session_state.get("aws_override_enabled", False)
-    if has_credentials:
-        status_text = "✅ **Role is configured.** Click below to scan." + (" Select a region for regional scan." if scan_mode == "regional" else "")
-        status_bg, status_border, status_text_color = "#e7f5e7", "#28a745", "#155724"
-    else:
-        status_text = "⏳ **Configure your IAM Role in Step 1** to enable scanning."
-        status_bg, status_border, status_text_color = "#f8f9fa", "#6c757d", "#495057"
-    st.markdown(f"<div style='padding: 0.75rem 1rem; background-color: {status_bg}; border-left: 4px solid {status_border}; border-radius: 6px; margin-bottom: 1rem; color: {status_text_color};'>{status_text}</div>", unsafe_allow_html=True)
-    selected_region = _render_region_selector() if scan_mode == "regional" else None
-    if has_credentials:
-        button_text = "🌍 Run Global Scan" if scan_mode == "global" else f"📍 Run Regional Scan ({selected_region})"
-        scan_region = None if scan_mode == "global" else selected_region
-        if st.button(button_text, type="primary", use_container_width=True):
-            with st.spinner("Scanning..." if scan_mode == "regional" else "Scanning all enabled AWS regions..."):
-                try:
-                    ec2_df = run_aws_scan(region=scan_region)
-                    if not ec2_df.empty:
-                        st.success("✅ **Scan complete!** Found AWS resources.")
-                        st.info(f"📊 Found {len(ec2_df)} EC2 instances.")
-                        st.balloons()
-                    else:
-                        st.warning("⚠️ **Scan completed but no resources found.**")
-                except Exception as e:
-                    st.error(f"❌ **Scan failed:** {str(e)}")
-                    st.exception(e)
-    else:
-        st.button("Run Scan", type="secondary", use_container_width=True, disabled=True)
-    st.markdown("---")
-    if st.session_state.get("last_scan_at"):
-        st.markdown("### Ready to explore?")
-        if st.button("📊 Go to Overview", type="secondary", use_container_width=True):
-            st.info("💡 Use the sidebar to open **Overview** or **Optimization**.")
+    _render_scan_step(scan_mode)
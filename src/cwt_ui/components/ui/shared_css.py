@@ -3,11 +3,10 @@ Shared CSS styles for all pages.
 This reduces line count while keeping the beautiful look.
 """
 
-def load_beautiful_css():
-    """Load beautiful CSS that all pages can use."""
-    import streamlit as st
-    
-    st.markdown("""
+import streamlit as st
+
+# Built once at import; every page header re-emits it (Streamlit drops elements not sent on a rerun)
+_BEAUTIFUL_CSS = """
     <style>
         /* Import Google Fonts */
         @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
@@ -288,28 +287,9 @@ def load_beautiful_css():
             }
         }
     </style>
-    """, unsafe_allow_html=True)
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+    """
 
 
+def load_beautiful_css():
+    """Load beautiful CSS that all pages can use."""
+    st.markdown(_BEAUTIFUL_CSS, unsafe_allow_html=True)
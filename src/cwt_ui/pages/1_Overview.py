@@ -1,14 +1,9 @@
 # pages/1_Overview.py — Overview (default home)
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-for p in [Path(__file__).resolve().parent, *Path(__file__).resolve().parent.parents]:
-    if (p / "src").exists() and str(p / "src") not in sys.path:
-        sys.path.insert(0, str(p / "src"))
-        break
+import _bootstrap  # noqa: F401  (puts src/ on sys.path before any cwt_ui import)
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -301,11 +296,12 @@ CATEGORY_COLORS = {
 if not spend_df.empty and spend_total_usd and spend_total_usd > 0:
     by_service = spend_df.groupby("service", as_index=False)["amount_usd"].sum().sort_values("amount_usd", ascending=False)
     top5 = by_service.head(5)
-    top_drivers = " · ".join([f"<strong>{r['service']}</strong> {format_usd(r['amount_usd'])}" for _, r in top5.iterrows()])
+    top_drivers = " · ".join(f"<strong>{svc}</strong> {format_usd(amt)}" for svc, amt in zip(top5["service"], top5["amount_usd"]))
     by_account_html = ""
     if "linked_account_id" in spend_df.columns and spend_df["linked_account_id"].notna().any():
         by_account = spend_df.groupby("linked_account_name", as_index=False)["amount_usd"].sum().sort_values("amount_usd", ascending=False)
-        top3_accounts = " · ".join([f"<strong>{r['linked_account_name']}</strong> {format_usd(r['amount_usd'])}" for _, r in by_account.head(3).iterrows()])
+        top3 = by_account.head(3)
+        top3_accounts = " · ".join(f"<strong>{acct}</strong> {format_usd(amt)}" for acct, amt in zip(top3["linked_account_name"], top3["amount_usd"]))
         by_account_html = f'<div class="overview-breakdown-context" style="margin-bottom:8px;"><strong>Spend by linked account:</strong> {top3_accounts}</div>'
 
     if "category" in spend_df.columns and spend_df["category"].notna().any():
@@ -314,9 +310,7 @@ if not spend_df.empty and spend_total_usd and spend_total_usd > 0:
         if total_cat > 0:
             segs = []
             leg_items = []
-            for _, row in by_cat.iterrows():
-                cat = row["category"]
-                amt = float(row["amount_usd"])
+            for cat, amt in zip(by_cat["category"], by_cat["amount_usd"].astype(float)):
                 pct = round(100 * amt / total_cat, 1)
                 color = CATEGORY_COLORS.get(cat, "#64748b")
                 segs.append(f'<div class="overview-breakdown-seg" style="width:{max(0.5, 100*amt/total_cat)}%;background:{color};" title="{cat} {format_usd(amt)}"></div>')
@@ -424,14 +418,13 @@ if ec2_df is not None and not ec2_df.empty and action_count > 0:
     dept_col = "department" if "department" in ec2_df.columns else None
 
     if savings_col and id_col and rec_col:
-        # Start here: single biggest lever (ensure best is always a row, not a scalar)
-        ser_all = pd.to_numeric(ec2_df[savings_col], errors="coerce").fillna(0)
-        if ser_all.astype(float).sum() > 0:
-            best_idx = ser_all.idxmax()
-            best_row = ec2_df.loc[best_idx]
-            best = best_row.iloc[0] if isinstance(best_row, pd.DataFrame) else best_row
-            best_id = best.get(id_col, "—") if hasattr(best, "get") else str(best)
-            best_savings = best.get(savings_col, 0) if hasattr(best, "get") else 0
+        # Start here: single biggest lever. Rows are picked by position throughout this section,
+        # since scan frames may carry a non-unique index that label lookups would fan out on.
+        savings = pd.to_numeric(ec2_df[savings_col], errors="coerce").fillna(0).to_numpy(dtype=float)
+        if savings.sum() > 0:
+            best = ec2_df.iloc[int(savings.argmax())]
+            best_id = best.get(id_col, "—")
+            best_savings = best.get(savings_col, 0)
             st.markdown(
                 f'<div class="overview-delta-box" style="border-left:4px solid #22c55e;">'
                 f'<div class="overview-delta-item">🎯 <strong>Start here:</strong> <span class="overview-rec-id">{best_id}</span> — '
@@ -448,22 +441,21 @@ if ec2_df is not None and not ec2_df.empty and action_count > 0:
             key="overview_rec_sort",
             help="Order by savings impact, instance ID, or department.",
         )
-        ser = pd.to_numeric(ec2_df[savings_col], errors="coerce").fillna(0)
-        rec_df_full = ec2_df.copy()
-        if sort_by == "Savings impact (highest first)":
-            rec_df_full = rec_df_full.sort_values(savings_col, ascending=False)
-        elif sort_by == "Instance ID":
-            rec_df_full = rec_df_full.sort_values(id_col, ascending=True)
+        # Only the top 5 are shown: select them without copying or fully sorting the frame
+        rec_count = len(ec2_df)
+        if sort_by == "Instance ID":
+            top_pos = ec2_df[id_col].reset_index(drop=True).sort_values(kind="stable").index[:5].to_numpy()
+        elif sort_by == "Department (team)" and dept_col:
+            keys = pd.DataFrame({"dept": ec2_df[dept_col].to_numpy(), "savings": savings})
+            top_pos = keys.sort_values(["dept", "savings"], ascending=[True, False], kind="stable").index[:5].to_numpy()
         else:
-            if dept_col and dept_col in rec_df_full.columns:
-                rec_df_full = rec_df_full.sort_values([dept_col, savings_col], ascending=[True, False])
-            else:
-                rec_df_full = rec_df_full.sort_values(savings_col, ascending=False)
-        rec_count = len(rec_df_full)
-        rec_df_display = rec_df_full.head(5)
+            top_pos = np.argsort(-savings, kind="stable")[:5]
+        rec_df_display = ec2_df.iloc[top_pos]
 
-        for idx, row in rec_df_display.iterrows():
-            save_val = float(row.get(savings_col, 0) or 0)
+        # Savings were already coerced and zero-filled; take them from there instead of a
+        # per-row get/or/float
+        display_savings = savings[top_pos]
+        for idx, save_val, row in zip(top_pos, display_savings, rec_df_display.to_dict("records")):
             sev_key, sev_label = _severity(save_val)
             inst_id = row.get(id_col, "—")
             rec_text = row.get(rec_col, "—")
@@ -1,14 +1,9 @@
 # pages/4_Optimization.py — Optimization (waste, rightsizing, recommendations)
 from __future__ import annotations
 
-import sys
 import traceback
-from pathlib import Path
 
-for p in [Path(__file__).resolve().parent, *Path(__file__).resolve().parent.parents]:
-    if (p / "src").exists() and str(p / "src") not in sys.path:
-        sys.path.insert(0, str(p / "src"))
-        break
+import _bootstrap  # noqa: F401  (puts src/ on sys.path before any cwt_ui import)
 
 import pandas as pd
 import streamlit as st
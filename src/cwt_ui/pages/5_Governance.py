@@ -1,13 +1,7 @@
 # pages/5_Governance.py — Governance
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-for p in [Path(__file__).resolve().parent, *Path(__file__).resolve().parent.parents]:
-    if (p / "src").exists() and str(p / "src") not in sys.path:
-        sys.path.insert(0, str(p / "src"))
-        break
+import _bootstrap  # noqa: F401  (puts src/ on sys.path before any cwt_ui import)
 
 import pandas as pd
 import streamlit as st
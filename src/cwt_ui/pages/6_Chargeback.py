@@ -1,13 +1,7 @@
 # pages/6_Chargeback.py — Chargeback
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-for p in [Path(__file__).resolve().parent, *Path(__file__).resolve().parent.parents]:
-    if (p / "src").exists() and str(p / "src") not in sys.path:
-        sys.path.insert(0, str(p / "src"))
-        break
+import _bootstrap  # noqa: F401  (puts src/ on sys.path before any cwt_ui import)
 
 import pandas as pd
 import streamlit as st
@@ -98,8 +92,10 @@ st.markdown("### Detail table")
 st.caption("Filter by service, team, environment, or cost center.")
 
 # Filters
-detail = spend_df.copy()
-detail["service_display"] = detail["service"].map(lambda s: SERVICE_TO_AWS_NAME.get(s, s))
+# Dict-backed map (hash lookup, no Python call per row); unmapped services keep their own name
+detail = spend_df.assign(
+    service_display=spend_df["service"].map(SERVICE_TO_AWS_NAME).fillna(spend_df["service"])
+)
 
 filter_col1, filter_col2, filter_col3 = st.columns(3)
 with filter_col1:
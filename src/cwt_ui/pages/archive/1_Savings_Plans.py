@@ -1,20 +1,13 @@
 from __future__ import annotations
 
 import os
-import sys
-from pathlib import Path
 from datetime import date, timedelta
 from typing import Tuple
 
-CURRENT_DIR = Path(__file__).resolve().parent
-for candidate in [CURRENT_DIR, *CURRENT_DIR.parents]:
-    candidate_src = candidate / "src"
-    if candidate_src.exists():
-        if str(candidate_src) not in sys.path:
-            sys.path.insert(0, str(candidate_src))
-        break
+import _bootstrap  # noqa: F401  (puts src/ on sys.path before any cwt_ui import)
 
 import altair as alt
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -39,20 +32,18 @@ def compute_utilization_trend(history_df: pd.DataFrame) -> pd.DataFrame:
     if history_df is None or history_df.empty:
         return pd.DataFrame(columns=["date", "utilization_pct", "used_per_hour", "commitment_per_hour"])
 
-    working = history_df.copy()
-    working["date"] = pd.to_datetime(working["date"])
+    # date is parsed once in load_savings_plan_data
     grouped = (
-        working.groupby("date")[["used_per_hour", "commitment_per_hour"]]
+        history_df.groupby("date")[["used_per_hour", "commitment_per_hour"]]
         .sum()
         .reset_index()
         .sort_values("date")
     )
-    grouped["utilization_pct"] = grouped.apply(
-        lambda row: (row["used_per_hour"] / row["commitment_per_hour"]) * 100.0
-        if row["commitment_per_hour"]
-        else 0.0,
-        axis=1,
-    )
+    # Column arithmetic instead of a per-row apply; days without commitment report 0%
+    commitment = grouped["commitment_per_hour"]
+    grouped["utilization_pct"] = (
+        grouped["used_per_hour"] / commitment.where(commitment != 0, 1) * 100.0
+    ).where(commitment != 0, 0.0)
     return grouped
 
 
@@ -61,20 +52,18 @@ def compute_coverage_trend(history_df: pd.DataFrame) -> pd.DataFrame:
     if history_df is None or history_df.empty:
         return pd.DataFrame(columns=["date", "covered_spend", "ondemand_spend", "coverage_pct"])
 
-    working = history_df.copy()
-    working["date"] = pd.to_datetime(working["date"])
+    # date is parsed once in load_savings_plan_data
     grouped = (
-        working.groupby("date")[["covered_spend", "ondemand_spend"]]
+        history_df.groupby("date")[["covered_spend", "ondemand_spend"]]
         .sum()
         .reset_index()
         .sort_values("date")
     )
-    grouped["coverage_pct"] = grouped.apply(
-        lambda row: (row["covered_spend"] / (row["covered_spend"] + row["ondemand_spend"])) * 100.0
-        if (row["covered_spend"] + row["ondemand_spend"])
-        else 0.0,
-        axis=1,
-    )
+    # Same vectorized form as the utilization trend; days with no spend report 0%
+    total = grouped["covered_spend"] + grouped["ondemand_spend"]
+    grouped["coverage_pct"] = (
+        grouped["covered_spend"] / total.where(total != 0, 1) * 100.0
+    ).where(total != 0, 0.0)
     return grouped
 
 
@@ -82,11 +71,8 @@ def plot_utilization_trend(util_trend_df: pd.DataFrame) -> alt.Chart | None:
     if util_trend_df.empty:
         return None
 
-    data = util_trend_df.copy()
-    data["date"] = pd.to_datetime(data["date"])
-
     return (
-        alt.Chart(data)
+        alt.Chart(util_trend_df)
         .mark_line(point=True)
         .encode(
             x=alt.X("date:T", title="Date"),
@@ -106,9 +92,7 @@ def plot_coverage_vs_ondemand(coverage_df: pd.DataFrame) -> alt.Chart | None:
     if coverage_df.empty:
         return None
 
-    data = coverage_df.copy()
-    data["date"] = pd.to_datetime(data["date"])
-    melted = data.melt(
+    melted = coverage_df.melt(
         id_vars=["date"], value_vars=["covered_spend", "ondemand_spend"], var_name="category", value_name="amount"
     )
     category_names = {
@@ -134,6 +118,39 @@ def plot_coverage_vs_ondemand(coverage_df: pd.DataFrame) -> alt.Chart | None:
     )
 
 
+def _with_plan_fields(history_df: pd.DataFrame, plan_lookups: dict[str, dict]) -> pd.DataFrame:
+    """history_df plus the Region/Type of each row's savings_plan_arn (NaN for unknown ARNs,
+    as the previous left merge gave)."""
+    arns = history_df["savings_plan_arn"]
+    return history_df.assign(**{field: arns.map(lookup) for field, lookup in plan_lookups.items()})
+
+
+def _filter_history(
+    history_df: pd.DataFrame,
+    value_cols: list[str],
+    plan_lookups: dict[str, dict] | None,
+    selected_regions: list[str],
+    selected_types: list[str],
+    start_ts: pd.Timestamp,
+    end_ts: pd.Timestamp,
+) -> pd.DataFrame:
+    """Region/Type/date-filtered history as one combined mask and a single .loc that also
+    selects value_cols (those present)."""
+    if history_df.empty:
+        return history_df
+    mask = np.ones(len(history_df), dtype=bool)
+    if "savings_plan_arn" in history_df.columns and plan_lookups:
+        history_df = _with_plan_fields(history_df, plan_lookups)
+        if selected_regions:
+            mask &= history_df["Region"].isin(selected_regions).to_numpy()
+        if selected_types:
+            mask &= history_df["Type"].isin(selected_types).to_numpy()
+    if "date" in history_df.columns:
+        mask &= history_df["date"].between(start_ts, end_ts).to_numpy()
+    cols = [c for c in value_cols if c in history_df.columns] or list(history_df.columns)
+    return history_df.loc[mask, cols]
+
+
 def render_insights(plans_df: pd.DataFrame, coverage_history_df: pd.DataFrame) -> None:
     insights = build_insights(plans_df, coverage_history_df)
     for insight in insights:
@@ -245,11 +262,28 @@ def _generate_mock_data() -> Tuple[pd.DataFrame, dict, pd.DataFrame, pd.DataFram
     return create_mock_sp_df()
 
 
+def _prepare_history(history_df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of history_df with date parsed to datetime64 once (filters, trends and charts below
+    compare and group on it without re-parsing) and savings_plan_arn as a categorical, so the
+    ARN lookups map each distinct plan once."""
+    columns = {}
+    if "date" in history_df.columns:
+        columns["date"] = pd.to_datetime(history_df["date"], errors="coerce")
+    if "savings_plan_arn" in history_df.columns:
+        columns["savings_plan_arn"] = history_df["savings_plan_arn"].astype("category")
+    return history_df.assign(**columns) if columns else history_df.copy()
+
+
+def _prepare_plans(plans_df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of plans_df with the few-valued Region/Type filter columns as categoricals."""
+    return plans_df.astype({c: "category" for c in ("Region", "Type") if c in plans_df.columns})
+
+
 def load_savings_plan_data() -> Tuple[pd.DataFrame, dict, pd.DataFrame, pd.DataFrame, bool]:
     demo_mode = os.getenv("CWT_DEMO_MODE", "false").strip().lower() == "true"
     if demo_mode:
         plans, summary, util_history, coverage_history = create_mock_sp_df()
-        return plans, summary, util_history, coverage_history, True
+        return _prepare_plans(plans), summary, _prepare_history(util_history), _prepare_history(coverage_history), True
 
     plans_df = st.session_state.get("SP_DF")
     summary = st.session_state.get("SP_SUMMARY", {})
@@ -259,7 +293,7 @@ def load_savings_plan_data() -> Tuple[pd.DataFrame, dict, pd.DataFrame, pd.DataF
     if plans_df is None:
         plans_df = pd.DataFrame()
 
-    return plans_df.copy(), summary, util_history_df.copy(), coverage_history_df.copy(), False
+    return _prepare_plans(plans_df), summary, _prepare_history(util_history_df), _prepare_history(coverage_history_df), False
 
 
 # Page layout (skip when embedded in Optimization > Commitment tab)
@@ -325,19 +359,19 @@ with filter_cols[1]:
         default=available_types,
     )
 
-date_parts = []
-if "date" in util_history_df.columns:
-    date_parts.append(pd.to_datetime(util_history_df["date"], errors="coerce"))
-if "date" in coverage_history_df.columns:
-    date_parts.append(pd.to_datetime(coverage_history_df["date"], errors="coerce"))
-date_source = pd.concat(date_parts, ignore_index=True).dropna() if date_parts else pd.Series(dtype="datetime64[ns]")
+# Per-frame min/max reductions (NaT skipped) instead of concatenating both date columns
+date_mins, date_maxes = [], []
+for history in (util_history_df, coverage_history_df):
+    if "date" in history.columns and history["date"].notna().any():
+        date_mins.append(history["date"].min())
+        date_maxes.append(history["date"].max())
 
-if date_source.empty:
+if not date_mins:
     default_start = date.today() - timedelta(days=DEFAULT_LOOKBACK_DAYS)
     default_end = date.today()
 else:
-    default_start = date_source.min().date()
-    default_end = date_source.max().date()
+    default_start = min(date_mins).date()
+    default_end = max(date_maxes).date()
 
 with filter_cols[2]:
     start_date, end_date = st.date_input(
@@ -348,61 +382,33 @@ with filter_cols[2]:
     )
 
 # Apply filters
-filtered_plans = plans_df.copy()
+start_ts, end_ts = pd.Timestamp(start_date), pd.Timestamp(end_date)
+plan_mask = np.ones(len(plans_df), dtype=bool)
 if selected_regions:
-    filtered_plans = filtered_plans[filtered_plans["Region"].isin(selected_regions)]
+    plan_mask &= plans_df["Region"].isin(selected_regions).to_numpy()
 if selected_types:
-    filtered_plans = filtered_plans[filtered_plans["Type"].isin(selected_types)]
-
-# Util history: merge with plans only when per-ARN data exists; else use aggregated data
-filtered_util_history = util_history_df.copy()
-if not filtered_util_history.empty:
-    has_util_arn = "savings_plan_arn" in filtered_util_history.columns
-    has_plans_arn = not plans_df.empty and "Savings Plan Arn" in plans_df.columns
-    if has_util_arn and has_plans_arn:
-        filtered_util_history = filtered_util_history.merge(
-            plans_df[["Savings Plan Arn", "Region", "Type"]],
-            how="left",
-            left_on="savings_plan_arn",
-            right_on="Savings Plan Arn",
-        )
-        if selected_regions:
-            filtered_util_history = filtered_util_history[filtered_util_history["Region"].isin(selected_regions)]
-        if selected_types:
-            filtered_util_history = filtered_util_history[filtered_util_history["Type"].isin(selected_types)]
-    if "date" in filtered_util_history.columns:
-        filtered_util_history = filtered_util_history[
-            (pd.to_datetime(filtered_util_history["date"], errors="coerce") >= pd.to_datetime(start_date))
-            & (pd.to_datetime(filtered_util_history["date"], errors="coerce") <= pd.to_datetime(end_date))
-        ]
-    util_cols = [c for c in ["date", "savings_plan_arn", "utilization_pct", "used_per_hour", "commitment_per_hour"] if c in filtered_util_history.columns]
-    if util_cols:
-        filtered_util_history = filtered_util_history[util_cols]
-
-# Coverage history: same defensive handling
-filtered_coverage_history = coverage_history_df.copy()
-if not filtered_coverage_history.empty:
-    has_cov_arn = "savings_plan_arn" in filtered_coverage_history.columns
-    has_plans_arn = not plans_df.empty and "Savings Plan Arn" in plans_df.columns
-    if has_cov_arn and has_plans_arn:
-        filtered_coverage_history = filtered_coverage_history.merge(
-            plans_df[["Savings Plan Arn", "Region", "Type"]],
-            how="left",
-            left_on="savings_plan_arn",
-            right_on="Savings Plan Arn",
-        )
-        if selected_regions:
-            filtered_coverage_history = filtered_coverage_history[filtered_coverage_history["Region"].isin(selected_regions)]
-        if selected_types:
-            filtered_coverage_history = filtered_coverage_history[filtered_coverage_history["Type"].isin(selected_types)]
-    if "date" in filtered_coverage_history.columns:
-        filtered_coverage_history = filtered_coverage_history[
-            (pd.to_datetime(filtered_coverage_history["date"], errors="coerce") >= pd.to_datetime(start_date))
-            & (pd.to_datetime(filtered_coverage_history["date"], errors="coerce") <= pd.to_datetime(end_date))
-        ]
-    cov_cols = [c for c in ["date", "savings_plan_arn", "coverage_pct", "covered_spend", "ondemand_spend"] if c in filtered_coverage_history.columns]
-    if cov_cols:
-        filtered_coverage_history = filtered_coverage_history[cov_cols]
+    plan_mask &= plans_df["Type"].isin(selected_types).to_numpy()
+filtered_plans = plans_df[plan_mask]
+
+# ARN -> Region / Type, built once and shared by both histories (a dict map instead of a merge each)
+plan_lookups = None
+if not plans_df.empty and "Savings Plan Arn" in plans_df.columns:
+    plan_lookups = {
+        "Region": dict(zip(plans_df["Savings Plan Arn"], plans_df["Region"])),
+        "Type": dict(zip(plans_df["Savings Plan Arn"], plans_df["Type"])),
+    }
+
+# Histories: Region/Type filters apply only when per-ARN data exists; else use aggregated data
+filtered_util_history = _filter_history(
+    util_history_df,
+    ["date", "savings_plan_arn", "utilization_pct", "used_per_hour", "commitment_per_hour"],
+    plan_lookups, selected_regions, selected_types, start_ts, end_ts,
+)
+filtered_coverage_history = _filter_history(
+    coverage_history_df,
+    ["date", "savings_plan_arn", "coverage_pct", "covered_spend", "ondemand_spend"],
+    plan_lookups, selected_regions, selected_types, start_ts, end_ts,
+)
 
 util_trend_df = compute_utilization_trend(filtered_util_history)
 coverage_trend_df = compute_coverage_trend(filtered_coverage_history)
@@ -455,16 +461,20 @@ table_cols = [
 ]
 if "Covers" in filtered_plans.columns:
     table_cols.insert(3, "Covers")  # After Type
-table_df = filtered_plans[[c for c in table_cols if c in filtered_plans.columns]].copy()
-
-table_df["Commitment ($/hr)"] = table_df["Commitment ($/hr)"].apply(lambda x: format_usd(x, 2))
-table_df["Actual Usage ($/hr)"] = table_df["Actual Usage ($/hr)"].apply(lambda x: format_usd(x, 2))
-table_df["Unused Commitment ($/hr)"] = table_df["Unused Commitment ($/hr)"].apply(lambda x: format_usd(x, 2))
-table_df["Utilization %"] = table_df["Utilization %"].map(lambda x: f"{x:.2f}%")
-table_df["Coverage %"] = table_df["Coverage %"].map(lambda x: f"{x:.2f}%")
-table_df["Forecast Utilization %"] = table_df["Forecast Utilization %"].map(lambda x: f"{x:.2f}%")
-
-st.dataframe(table_df, use_container_width=True, hide_index=True)
+table_df = filtered_plans[[c for c in table_cols if c in filtered_plans.columns]]
+st.dataframe(
+    table_df,
+    use_container_width=True,
+    hide_index=True,
+    column_config={
+        "Commitment ($/hr)": st.column_config.NumberColumn("Commitment ($/hr)", format="$%.2f"),
+        "Actual Usage ($/hr)": st.column_config.NumberColumn("Actual Usage ($/hr)", format="$%.2f"),
+        "Unused Commitment ($/hr)": st.column_config.NumberColumn("Unused Commitment ($/hr)", format="$%.2f"),
+        "Utilization %": st.column_config.NumberColumn("Utilization %", format="%.2f%%"),
+        "Coverage %": st.column_config.NumberColumn("Coverage %", format="%.2f%%"),
+        "Forecast Utilization %": st.column_config.NumberColumn("Forecast Utilization %", format="%.2f%%"),
+    },
+)
 
 chart_col1, chart_col2 = st.columns(2)
 with chart_col1:
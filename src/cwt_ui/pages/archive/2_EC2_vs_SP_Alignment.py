@@ -1,18 +1,10 @@
 from __future__ import annotations
 
 import os
-import sys
-from pathlib import Path
 from datetime import date, timedelta
 from typing import Tuple
 
-CURRENT_DIR = Path(__file__).resolve().parent
-for candidate in [CURRENT_DIR, *CURRENT_DIR.parents]:
-    candidate_src = candidate / "src"
-    if candidate_src.exists():
-        if str(candidate_src) not in sys.path:
-            sys.path.insert(0, str(candidate_src))
-        break
+import _bootstrap  # noqa: F401  (puts src/ on sys.path before any cwt_ui import)
 
 import altair as alt
 import pandas as pd
@@ -1098,16 +1090,21 @@ table_df = filtered_df[
         "Potential Savings (Monthly)",
         "Recommendation",
     ]
-].copy()
-
-# Format columns for display
-table_df["On-Demand Rate ($/hr)"] = table_df["On-Demand Rate ($/hr)"].apply(lambda x: format_usd(x, 4))
-table_df["SP Coverage ($/hr)"] = table_df["SP Coverage ($/hr)"].apply(lambda x: format_usd(x, 4))
-table_df["Potential Savings (Monthly)"] = table_df["Potential Savings (Monthly)"].apply(lambda x: format_usd(x, 2))
-table_df["CPU Utilization %"] = table_df["CPU Utilization %"].apply(lambda x: f"{x:.1f}%")
-table_df["Idle Score"] = table_df["Idle Score"].apply(lambda x: f"{x:.0f}")
-
-st.dataframe(table_df, use_container_width=True, hide_index=True)
+]
+
+# Values stay numeric; column_config formats them in the browser
+st.dataframe(
+    table_df,
+    use_container_width=True,
+    hide_index=True,
+    column_config={
+        "CPU Utilization %": st.column_config.NumberColumn("CPU Utilization %", format="%.1f%%"),
+        "Idle Score": st.column_config.NumberColumn("Idle Score", format="%.0f"),
+        "On-Demand Rate ($/hr)": st.column_config.NumberColumn("On-Demand Rate ($/hr)", format="$%.4f"),
+        "SP Coverage ($/hr)": st.column_config.NumberColumn("SP Coverage ($/hr)", format="$%.4f"),
+        "Potential Savings (Monthly)": st.column_config.NumberColumn("Potential Savings (Monthly)", format="$%.2f"),
+    },
+)
 
 # Insights Section
 st.markdown("## ⚡ Insights")
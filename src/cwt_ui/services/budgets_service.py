@@ -32,15 +32,34 @@ DAYS_ELAPSED = 15
 DAYS_IN_PERIOD = 30
 
 
-def _consumed_for_scope(spend_df: pd.DataFrame, scope_type: str, scope_key: str | None, scope_value: str | None) -> float:
-    """Sum spend where scope matches."""
-    if spend_df.empty:
-        return 0.0
+def _scope_sums(spend_df: pd.DataFrame) -> tuple[float, dict[str, pd.Series]]:
+    """Total spend plus, for each tag key the budget defs scope on, spend summed per tag value.
+
+    Amounts are coerced once and each key is grouped once, so every budget is a lookup rather
+    than another masked scan of spend_df.
+    """
+    amounts = pd.to_numeric(spend_df["amount_usd"], errors="coerce").fillna(0)
+    tag_keys = {key for _, _, scope_type, key, _ in SYNTHETIC_BUDGET_DEFS if scope_type == "tag" and key}
+    sums_by_key = {
+        key: amounts.groupby(spend_df[key].astype(str)).sum()
+        for key in tag_keys
+        if key in spend_df.columns
+    }
+    return float(amounts.sum()), sums_by_key
+
+
+def _consumed_for_scope(
+    total: float,
+    sums_by_key: dict[str, pd.Series],
+    scope_type: str,
+    scope_key: str | None,
+    scope_value: str | None,
+) -> float:
+    """Spend where scope matches, looked up from _scope_sums."""
     if scope_type == "all":
-        return float(pd.to_numeric(spend_df["amount_usd"], errors="coerce").fillna(0).sum())
-    if scope_type == "tag" and scope_key and scope_value and scope_key in spend_df.columns:
-        mask = spend_df[scope_key].astype(str) == str(scope_value)
-        return float(pd.to_numeric(spend_df.loc[mask, "amount_usd"], errors="coerce").fillna(0).sum())
+        return total
+    if scope_type == "tag" and scope_key and scope_value and scope_key in sums_by_key:
+        return float(sums_by_key[scope_key].get(str(scope_value), 0.0))
     return 0.0
 
 
@@ -76,9 +95,10 @@ def get_budgets() -> list[Budget]:
     if spend_df.empty or "amount_usd" not in spend_df.columns:
         return []
 
+    total, sums_by_key = _scope_sums(spend_df)
     budgets: list[Budget] = []
     for name, amount, scope_type, scope_key, scope_value in SYNTHETIC_BUDGET_DEFS:
-        consumed = _consumed_for_scope(spend_df, scope_type, scope_key, scope_value)
+        consumed = _consumed_for_scope(total, sums_by_key, scope_type, scope_key, scope_value)
         consumed_pct = (consumed / amount * 100) if amount > 0 else 0.0
         status = _status(consumed_pct)
         forecast = _forecast(consumed)
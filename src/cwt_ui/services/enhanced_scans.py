@@ -6,13 +6,15 @@ This replaces the basic scans with much more valuable data.
 
 from __future__ import annotations
 from typing import Tuple, Optional, Mapping, List
+import numpy as np
 import pandas as pd
 import os
 
 def run_all_scans(
     region: str | List[str] | None = None, 
     aws_credentials: Optional[Mapping[str, str]] = None, 
-    aws_auth_method: str = "user"
+    aws_auth_method: str = "user",
+    aws_session=None,
 ) -> pd.DataFrame:
     """Run enhanced scans with clear cost analysis and actionable recommendations.
     
@@ -23,11 +25,17 @@ def run_all_scans(
             - None: auto-discover and scan all enabled regions
         aws_credentials: Optional credential overrides
         aws_auth_method: "user" or "role"
+        aws_session: Optional boto3 Session reused for all scanner clients
     """
     # Delegate to the main scans service which handles multi-region logic
     try:
         from cwt_ui.services.scans import run_all_scans as _run_all_scans
-        ec2_df = _run_all_scans(region=region, aws_credentials=aws_credentials, aws_auth_method=aws_auth_method)
+        ec2_df = _run_all_scans(
+            region=region,
+            aws_credentials=aws_credentials,
+            aws_auth_method=aws_auth_method,
+            aws_session=aws_session,
+        )
         
         # Enhance the results with better recommendations
         if not ec2_df.empty:
@@ -69,17 +77,6 @@ def _enhance_ec2_data(findings: list) -> pd.DataFrame:
         else:
             return f"✅ OK: {name} - CPU usage normal ({cpu:.1f}%)"
     
-    def get_priority(row):
-        cpu = row.get('avg_cpu_7d', 0)
-        if cpu < 1.0:
-            return "🔴 HIGH"
-        elif cpu < 3.0:
-            return "🔴 HIGH"
-        elif cpu < 5.0:
-            return "🟡 MEDIUM"
-        else:
-            return "🟢 LOW"
-    
     def get_action_steps(row):
         cpu = row.get('avg_cpu_7d', 0)
         cost = row.get('monthly_cost_usd', 0)
@@ -98,10 +95,12 @@ def _enhance_ec2_data(findings: list) -> pd.DataFrame:
     
     # Add enhanced columns
     df['clear_recommendation'] = df.apply(get_clear_recommendation, axis=1)
-    df['priority'] = df.apply(get_priority, axis=1)
+    # Priority and savings depend only on the CPU band, so compute them column-wise
+    cpu = df['avg_cpu_7d'].to_numpy() if 'avg_cpu_7d' in df.columns else np.zeros(len(df))
+    cost = df['monthly_cost_usd'].to_numpy() if 'monthly_cost_usd' in df.columns else np.zeros(len(df))
+    df['priority'] = np.select([cpu < 3.0, cpu < 5.0], ["🔴 HIGH", "🟡 MEDIUM"], default="🟢 LOW")
     df['action_steps'] = df.apply(get_action_steps, axis=1)
-    df['potential_savings_usd'] = df.apply(lambda row: 
-        row.get('monthly_cost_usd', 0) if row.get('avg_cpu_7d', 0) < 5.0 else 0, axis=1)
+    df['potential_savings_usd'] = np.where(cpu < 5.0, cost, 0)
     
     # Rename columns for clarity
     df = df.rename(columns={
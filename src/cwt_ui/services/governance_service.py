@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import repeat
 
 import pandas as pd
 import streamlit as st
@@ -74,13 +75,18 @@ def _derive_violations_from_ec2(ec2_df: pd.DataFrame) -> list[Violation]:
     if not rid_col or not itype_col:
         return violations
 
-    for _, row in ec2_df.iterrows():
-        resource_id = str(row.get(rid_col, ""))
-        instance_type = str(row.get(itype_col, ""))
-        region = str(row.get(region_col, "—"))
-        department = str(row.get(dept_col, ""))
-        environment = str(row.get(env_col, "prod"))
-
+    # Walk plain string columns instead of iterrows (one boxed Series per row); optional columns
+    # fall back to their default for every row
+    def _str_col(col: str | None, default: str):
+        return ec2_df[col].astype(str).tolist() if col else repeat(default)
+
+    for resource_id, instance_type, region, department, environment in zip(
+        ec2_df[rid_col].astype(str).tolist(),
+        ec2_df[itype_col].astype(str).tolist(),
+        _str_col(region_col, "—"),
+        _str_col(dept_col, ""),
+        _str_col(env_col, "prod"),
+    ):
         # Policy: No GPU instances
         if any(p in instance_type.lower() for p in GPU_PATTERNS):
             vid = f"no_gpu|{resource_id}"
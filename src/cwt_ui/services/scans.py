@@ -2,6 +2,7 @@
 from __future__ import annotations
 from typing import Tuple, Optional, Any, Iterable, Mapping, List
 import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 import pandas as pd
 import boto3
@@ -19,6 +20,10 @@ except Exception:
     scan_savings_plans = None  # type: ignore
 
 
+# Debug prints are on outside production; read once instead of per scan/region
+_DEBUG = os.getenv("APP_ENV", "development").strip().lower() != "production"
+
+
 _LAST_SAVINGS_PLAN_RESULTS: tuple[pd.DataFrame, dict, pd.DataFrame, pd.DataFrame] = (
     pd.DataFrame(),
     {},
@@ -33,7 +38,8 @@ _LAST_SAVINGS_PLAN_RESULTS: tuple[pd.DataFrame, dict, pd.DataFrame, pd.DataFrame
 def run_all_scans(
     region: str | List[str] | None = None, 
     aws_credentials: Optional[Mapping[str, str]] = None, 
-    aws_auth_method: str = "user"
+    aws_auth_method: str = "user",
+    aws_session: Optional[boto3.Session] = None,
 ) -> pd.DataFrame:
     """Run EC2 scans, returning normalized DataFrame for the UI.
     
@@ -47,6 +53,8 @@ def run_all_scans(
             - None: auto-discover and scan all enabled regions
         aws_credentials: Credential mapping for IAM User auth
         aws_auth_method: "user" or "role" - determines how credentials are used
+        aws_session: Optional pre-built boto3 Session (see _get_session) reused for
+            every scanner client instead of building clients from environment variables
     
     For IAM User auth, keys supported: "AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY",
     "AWS_DEFAULT_REGION", "AWS_SESSION_TOKEN" (optional).
@@ -78,8 +86,8 @@ def run_all_scans(
                         try:
                             from core.services.region_service import discover_enabled_regions
                             # Discover regions using temporary role credentials (in env now)
-                            regions = discover_enabled_regions(None, "user")  # Credentials are now in env
-                            if os.getenv("APP_ENV", "development").strip().lower() != "production":
+                            regions = discover_enabled_regions(None, "user", aws_session)  # Credentials are now in env
+                            if _DEBUG:
                                 print(f"DEBUG: Discovered {len(regions)} regions: {regions}")
                             if not regions:
                                 print("WARNING: No regions discovered, falling back to common regions")
@@ -94,7 +102,7 @@ def run_all_scans(
                     else:
                         regions = region
                     
-                    return _scan_multiple_regions(regions, None, "user")  # Credentials are in env
+                    return _scan_multiple_regions(regions, None, "user", aws_session)  # Credentials are in env
             else:
                 # Role assumption failed - raise an error with details
                 role_arn = aws_credentials.get("AWS_ROLE_ARN", "Unknown")
@@ -109,8 +117,8 @@ def run_all_scans(
         # Auto-discover all enabled regions
         try:
             from core.services.region_service import discover_enabled_regions
-            regions = discover_enabled_regions(aws_credentials, aws_auth_method)
-            if os.getenv("APP_ENV", "development").strip().lower() != "production":
+            regions = discover_enabled_regions(aws_credentials, aws_auth_method, aws_session)
+            if _DEBUG:
                 print(f"DEBUG: Discovered {len(regions)} regions: {regions}")
             if not regions:
                 from core.services.region_service import _common_regions
@@ -127,50 +135,62 @@ def run_all_scans(
     if aws_credentials:
         # Handle user-based authentication
         with _temporary_env(aws_credentials):
-            return _scan_multiple_regions(regions, aws_credentials, aws_auth_method)
+            return _scan_multiple_regions(regions, aws_credentials, aws_auth_method, aws_session)
     
-    return _scan_multiple_regions(regions, None, aws_auth_method)
+    return _scan_multiple_regions(regions, None, aws_auth_method, aws_session)
 
 
 def _scan_multiple_regions(
     regions: List[str],
     aws_credentials: Optional[Mapping[str, str]],
-    aws_auth_method: str
+    aws_auth_method: str,
+    aws_session: Optional[boto3.Session] = None,
 ) -> pd.DataFrame:
-    """Scan multiple regions and aggregate results."""
+    """Scan multiple regions and aggregate results.
+    
+    The Savings Plans refresh (Cost Explorer / savingsplans APIs, own boto3 Session)
+    is independent of the EC2 calls, so it runs on a worker thread alongside them.
+    """
     all_ec2_results = []
+    # The with-block joins the worker even if the region loop raises, so it never keeps
+    # writing _LAST_SAVINGS_PLAN_RESULTS after this call has returned
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="cwt-sp") as sp_pool:
+        sp_future = sp_pool.submit(_update_savings_plans_cache)
     
-    if os.getenv("APP_ENV", "development").strip().lower() != "production":
-        print(f"DEBUG: Starting scan of {len(regions)} regions: {regions}")
+        if _DEBUG:
+            print(f"DEBUG: Starting scan of {len(regions)} regions: {regions}")
     
-    for region in regions:
-        try:
-            if os.getenv("APP_ENV", "development").strip().lower() != "production":
-                print(f"DEBUG: Scanning region {region}...")
-            ec2_df = scan_ec2(region=region)
+        for region in regions:
+            try:
+                if _DEBUG:
+                    print(f"DEBUG: Scanning region {region}...")
+                ec2_df = scan_ec2(region=region, session=aws_session)
             
-            ec2_count = len(ec2_df) if not ec2_df.empty else 0
-            if os.getenv("APP_ENV", "development").strip().lower() != "production":
-                print(f"DEBUG: Region {region}: Found {ec2_count} EC2 instances")
+                ec2_count = len(ec2_df) if not ec2_df.empty else 0
+                if _DEBUG:
+                    print(f"DEBUG: Region {region}: Found {ec2_count} EC2 instances")
             
-            if not ec2_df.empty:
-                all_ec2_results.append(ec2_df)
-        except Exception as e:
-            # Log error but continue with other regions
-            print(f"⚠️  Error scanning {region}: {e}")
-            import traceback
-            print(traceback.format_exc())
-            continue
+                if not ec2_df.empty:
+                    all_ec2_results.append(ec2_df)
+            except Exception as e:
+                # Log error but continue with other regions
+                print(f"⚠️  Error scanning {region}: {e}")
+                import traceback
+                print(traceback.format_exc())
+                continue
     
-    # Combine results
-    final_ec2 = pd.concat(all_ec2_results, ignore_index=True) if all_ec2_results else pd.DataFrame()
+        # Combine results
+        final_ec2 = pd.concat(all_ec2_results, ignore_index=True) if all_ec2_results else pd.DataFrame()
     
-    if os.getenv("APP_ENV", "development").strip().lower() != "production":
-        print(f"DEBUG: Total results: {len(final_ec2)} EC2 instances")
+        if _DEBUG:
+            print(f"DEBUG: Total results: {len(final_ec2)} EC2 instances")
     
-    _update_savings_plans_cache()
+        # Wait inside any _temporary_env scope so the worker saw the same credentials
+        sp_future.result()
     
     return final_ec2
+
+
 def _update_savings_plans_cache() -> None:
     """Refresh cached Savings Plans utilization results."""
     global _LAST_SAVINGS_PLAN_RESULTS
@@ -191,7 +211,7 @@ def _update_savings_plans_cache() -> None:
 
 
 
-def scan_ec2(region: Optional[str] = None) -> pd.DataFrame:
+def scan_ec2(region: Optional[str] = None, session: Optional[boto3.Session] = None) -> pd.DataFrame:
     """
     Run the EC2 scan and return a normalized DataFrame for the UI.
     Recommended columns: instance_id, name, instance_type, region,
@@ -200,11 +220,16 @@ def scan_ec2(region: Optional[str] = None) -> pd.DataFrame:
     if _ec2_scanner is None:
         return _empty_ec2_frame()
 
+    kwargs: dict = {"region": region} if region else {}
+    if session is not None:
+        # Only scan_ec2 accepts a session; skip the legacy entry points in that case
+        return _normalize_ec2(_to_dataframe(_ec2_scanner.scan_ec2(session=session, **kwargs)))
+
     # Try several common entry points for backward compatibility
     data = _call_scanner(
         _ec2_scanner,
         preferred=["scan_ec2", "run", "run_ec2", "main"],
-        kwargs={"region": region} if region else {},
+        kwargs=kwargs,
     )
     df = _to_dataframe(data)
     return _normalize_ec2(df)
@@ -328,6 +353,25 @@ def _coerce_float(series: pd.Series) -> pd.Series:
         return series
 
 
+def _get_session(
+    access_key: str,
+    secret_key: str,
+    session_token: str = "",
+    region: str = "us-east-1",
+) -> boto3.Session:
+    """Return a new boto3 Session for the given credentials.
+
+    Not cached here: Sessions are not thread-safe and the arguments are secrets, so
+    callers that reuse one keep it per user (the UI holds it in ``st.session_state``).
+    """
+    return boto3.Session(
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        aws_session_token=session_token or None,
+        region_name=region,
+    )
+
+
 @contextmanager
 def _temporary_env(new_values: Mapping[str, str]):
     """Temporarily set environment variables, then restore originals.
@@ -377,7 +421,7 @@ def _assume_role(credentials: Mapping[str, str]) -> Optional[dict[str, str]]:
             print("ERROR: No role ARN provided")
             return None
             
-        if os.getenv("APP_ENV", "development").strip().lower() != "production":
+        if _DEBUG:
             print(f"DEBUG: Attempting to assume role {role_arn}")
             print(f"DEBUG: External ID: {'SET' if external_id else 'NOT SET'}")
             print(f"DEBUG: Session Name: {session_name}")
@@ -409,10 +453,10 @@ def _assume_role(credentials: Mapping[str, str]) -> Optional[dict[str, str]]:
         # Test base credentials first
         try:
             identity = sts_client.get_caller_identity()
-            if os.getenv("APP_ENV", "development").strip().lower() != "production":
+            if _DEBUG:
                 print(f"DEBUG: Base credentials work. Caller: {identity.get('Arn', 'Unknown')}")
         except Exception as e:
-            if os.getenv("APP_ENV", "development").strip().lower() != "production":
+            if _DEBUG:
                 print(f"DEBUG: Base credentials failed: {e}")
             return None
         
@@ -429,14 +473,15 @@ def _assume_role(credentials: Mapping[str, str]) -> Optional[dict[str, str]]:
         response = sts_client.assume_role(**assume_role_kwargs)
         
         creds = response['Credentials']
-        if os.getenv("APP_ENV", "development").strip().lower() != "production":
+        if _DEBUG:
             print(f"DEBUG: Successfully assumed role {role_arn}")
             print(f"DEBUG: Temporary credentials expire at: {creds['Expiration']}")
         return {
             'AWS_ACCESS_KEY_ID': creds['AccessKeyId'],
             'AWS_SECRET_ACCESS_KEY': creds['SecretAccessKey'],
             'AWS_SESSION_TOKEN': creds['SessionToken'],
-            'AWS_DEFAULT_REGION': region
+            'AWS_DEFAULT_REGION': region,
+            'AWS_CREDENTIAL_EXPIRATION': creds['Expiration'].isoformat(),
         }
         
     except ClientError as e:
@@ -48,8 +48,8 @@ def get_spend_from_scan(period: str = "this_month") -> tuple[float, pd.DataFrame
                     lambda s: pd.to_numeric(s, errors="coerce").fillna(0).sum()
                 ).reset_index()
                 by_region.columns = ["region", "amount_usd"]
-                for _, row in by_region.iterrows():
-                    rows.append({"service": "EC2", "region": str(row["region"]), "amount_usd": float(row["amount_usd"]), "category": "Compute"})
+                for region, amount in zip(by_region["region"], by_region["amount_usd"]):
+                    rows.append({"service": "EC2", "region": str(region), "amount_usd": float(amount), "category": "Compute"})
             else:
                 rows.append({"service": "EC2", "region": "—", "amount_usd": float(total_ec2), "category": "Compute"})
 
@@ -132,7 +132,11 @@ def _build_lambda_df() -> pd.DataFrame:
             "recommendation": rec,
             "potential_savings_usd": pot,
         })
-    return pd.DataFrame(rows)
+    df = pd.DataFrame(rows)
+    # Same dtypes as a real scan (see scan_service)
+    df["function_name"] = df["function_name"].astype("string[pyarrow]")
+    df["last_modified"] = pd.to_datetime(df["last_modified"], errors="coerce", utc=True)
+    return df.astype({"region": "category", "runtime": "category", "billing_type": "category"})
 
 
 def _build_fargate_df() -> pd.DataFrame:
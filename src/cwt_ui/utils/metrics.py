@@ -29,30 +29,15 @@ def compute_summary(df: pd.DataFrame) -> dict:
     cost_columns = ['monthly_cost_usd', 'Monthly Cost ($)', 'monthly_cost', 'cost']
     savings_columns = ['potential_savings_usd', 'Potential Savings ($)', 'potential_savings', 'savings']
     
-    # Find the actual cost column
-    cost_col = None
-    for col in cost_columns:
-        if col in df.columns:
-            cost_col = col
-            break
-    
-    # Find the actual savings column  
-    savings_col = None
-    for col in savings_columns:
-        if col in df.columns:
-            savings_col = col
-            break
+    # Find the actual cost and savings columns
+    cost_col = next((col for col in cost_columns if col in df.columns), None)
+    savings_col = next((col for col in savings_columns if col in df.columns), None)
     
     # Calculate totals
     total_cost = df[cost_col].sum() if cost_col else 0
     potential_savings = df[savings_col].sum() if savings_col else 0
     waste_count = len(df)
     
-    # Debug: Show what columns were found
-    debug_write(f"🔍 **Found cost column:** {cost_col}, **Found savings column:** {savings_col}")
-    debug_write(f"🔍 **Cost values:** {df[cost_col].tolist() if cost_col else 'None'}")
-    debug_write(f"🔍 **Savings values:** {df[savings_col].tolist() if savings_col else 'None'}")
-    
     return {
         "total_cost": total_cost,
         "potential_savings": potential_savings,
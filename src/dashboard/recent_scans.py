@@ -3,11 +3,14 @@ Recent Scans functionality for Dashboard
 """
 
 import pandas as pd
-from datetime import timedelta
+from datetime import timezone
+from zoneinfo import ZoneInfo
 from sqlalchemy import select, desc
 from db.db import get_db
 from db.models import Scan
 
+_IL_TZ = ZoneInfo("Asia/Jerusalem")
+
 
 def get_recent_scans(limit: int = 3) -> pd.DataFrame:
     """
@@ -34,8 +37,8 @@ def get_recent_scans(limit: int = 3) -> pd.DataFrame:
                 timestamp = scan.finished_at or scan.created_at
                 
                 if timestamp:
-                    # Convert UTC to Israel time (UTC+3)
-                    israel_time = timestamp + timedelta(hours=3)
+                    # Convert UTC to Israel time (DST-aware)
+                    israel_time = timestamp.replace(tzinfo=timezone.utc).astimezone(_IL_TZ)
                     time_str = israel_time.strftime("%H:%M:%S")
                 else:
                     time_str = "—"
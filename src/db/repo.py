@@ -1,10 +1,13 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
 from sqlalchemy import select, desc, delete
 from .db import get_db
 from .models import User, Scan, Finding
 import pandas as pd
 import json
 
+_IL_TZ = ZoneInfo("Asia/Jerusalem")
+
 # Import our new error handling and logging
 import sys
 from pathlib import Path
@@ -176,11 +179,10 @@ def get_last_scan() -> tuple[pd.DataFrame, str]:
             # Convert to DataFrame
             ec2_df = pd.DataFrame(ec2_data) if ec2_data else pd.DataFrame()
             
-            # Format timestamp - convert UTC to Israel time (UTC+3)
+            # Format timestamp - convert UTC to Israel time (DST-aware)
             if scan.finished_at:
-                from datetime import timedelta
-                israel_time = scan.finished_at + timedelta(hours=3)
-                scanned_at = israel_time.isoformat() + " (Israel Time)"
+                israel_time = scan.finished_at.replace(tzinfo=timezone.utc).astimezone(_IL_TZ)
+                scanned_at = israel_time.replace(microsecond=0, tzinfo=None).isoformat() + " (Israel Time)"
             else:
                 scanned_at = ""
             
@@ -48,7 +48,10 @@ def _estimate_monthly_cost(instance_type: str):
     return round(hourly * 24 * 30, 2)  # ~720h
 
 
-def _aws_client(service: str, region: str):
+def _aws_client(service: str, region: str, session: boto3.Session | None = None):
+    # Reuse the caller's session when given (avoids rebuilding credentials per client)
+    if session is not None:
+        return session.client(service, region_name=region)
     # Use environment variables only, no local credentials file
     return boto3.client(
         service, 
@@ -62,7 +65,7 @@ def _aws_client(service: str, region: str):
 # ----------------------
 # Scanners (EC2 / EBS / EIP)
 # ----------------------
-def scan_ec2_idle(region: str) -> List[Dict]:
+def scan_ec2_idle(region: str, session: boto3.Session | None = None) -> List[Dict]:
     """
     Return idle EC2 instance findings with enhanced cost analysis and recommendations.
     """
@@ -73,8 +76,8 @@ def scan_ec2_idle(region: str) -> List[Dict]:
         # Fallback to legacy pricing if service not available
         pricing_service = None
     
-    ec2 = _aws_client("ec2", region)
-    cw = _aws_client("cloudwatch", region)
+    ec2 = _aws_client("ec2", region, session)
+    cw = _aws_client("cloudwatch", region, session)
 
     reservations = ec2.describe_instances().get("Reservations", [])
     # Get ALL instances (not just running) - we need all states
@@ -274,14 +277,14 @@ def scan_eips_unassociated(region: str) -> List[Dict]:
 # ----------------------
 # Public entry points
 # ----------------------
-def scan_ec2(region: str | None = None):
+def scan_ec2(region: str | None = None, session: boto3.Session | None = None):
     """
     Primary entry point used by the UI adapter (scans.py).
     Returns a list[dict] for EC2 idle instances only (the EC2 page focuses on instances).
     Other findings (EBS/EIP) are still available via helper functions above if you want to surface them later.
     """
     region = region or DEFAULT_REGION
-    return scan_ec2_idle(region)
+    return scan_ec2_idle(region, session)
 
 
 def run(region: str | None = None):
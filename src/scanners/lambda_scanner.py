@@ -17,12 +17,20 @@ DEFAULT_REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
 # ----------------------
 # Helpers
 # ----------------------
-def _aws_client(service: str, region: str, aws_credentials: Dict[str, str] | None = None):
+def _aws_client(
+    service: str,
+    region: str,
+    aws_credentials: Dict[str, str] | None = None,
+    session: boto3.Session | None = None,
+):
     """Create AWS client with optional credentials override.
     
-    When aws_credentials is None, explicitly use environment variables to ensure
-    we use the temporary role credentials from _temporary_env context manager.
+    When a session is given, reuse it (shared with the EC2 scan) instead of building
+    new credentials. When aws_credentials is None, explicitly use environment variables
+    to ensure we use the temporary role credentials from _temporary_env context manager.
     """
+    if session is not None:
+        return session.client(service, region_name=region)
     # If credentials provided, use them; otherwise rely on environment variables
     if aws_credentials and "AWS_ACCESS_KEY_ID" in aws_credentials:
         # For role-based auth, credentials are already assumed role credentials
@@ -48,7 +56,11 @@ def _aws_client(service: str, region: str, aws_credentials: Dict[str, str] | Non
 # ----------------------
 # Scanner
 # ----------------------
-def scan_lambda_functions(region: str, aws_credentials: Dict[str, str] | None = None) -> List[Dict]:
+def scan_lambda_functions(
+    region: str,
+    aws_credentials: Dict[str, str] | None = None,
+    session: boto3.Session | None = None,
+) -> List[Dict]:
     """
     Scan Lambda functions in the specified region.
     
@@ -60,7 +72,7 @@ def scan_lambda_functions(region: str, aws_credentials: Dict[str, str] | None =
     - timeout_seconds: Timeout in seconds
     - last_modified: Last modified date (ISO format string)
     """
-    lambda_client = _aws_client("lambda", region, aws_credentials)
+    lambda_client = _aws_client("lambda", region, aws_credentials, session)
     
     findings: List[Dict] = []
     